@@ -24,6 +24,24 @@ a = Analysis(
         'openpyxl.worksheet',
         'xlrd',
         'xlrd.biffh',
+        'pyarrow',
+        'pandas.io.parquet',
+        
+        # Shared engine
+        'bankily_engine',
+        'bankily_engine.cache',
+        'bankily_engine.ingestion',
+        'bankily_engine.logos',
+        'bankily_engine.rapport',
+        'bankily_engine.rendu_canvas',
+        'bankily_engine.mesures',
+        'bankily_engine.annulation',
+        'bankily_engine.reprise',
+        'bankily_engine.generation',
+        'bankily_engine.cache_pdf',
+        'bankily_engine.pompe',
+        'bankily_engine.agents',
+        'interface_multi',
         
         # ReportLab dependencies
         'reportlab',
@@ -50,6 +68,8 @@ a = Analysis(
         # System modules
         'tempfile',
         'threading',
+        'multiprocessing',
+        'concurrent.futures',
         'zipfile',
         'shutil',
         'datetime',
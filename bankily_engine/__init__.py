@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Moteur commun des générateurs de rapports BANKILY
+Code indépendant de Tkinter, partagé par les interfaces multi-centres,
+multi-commerçants et multi-agents
+"""
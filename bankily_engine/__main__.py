@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""Point d'entrée : python -m bankily_engine <centres|commercants|agents> fichier.xlsx"""
+
+import sys
+import multiprocessing
+
+from bankily_engine.cli import main
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports multi-agents : lecture et typage du fichier Excel, relevé PDF par agent
+"""
+
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+from reportlab.platypus import Spacer
+from reportlab.lib.units import cm
+
+from bankily_engine.cache import charger_avec_cache
+from bankily_engine.ingestion import lire_colonnes_excel, valeur_texte_ou_vide
+from bankily_engine.rapport import (
+    GenerateurPDF, colonne_texte, formater_dates, formater_nombre, formater_nombres
+)
+
+
+# Format Oracle "10-JUN-25 12.49.35.212000 PM" à largeur fixe (voie rapide)
+REGEX_DATE_ORACLE = r'\d{2}-[A-Za-z]{3}-\d{2} (0[1-9]|1[0-2])\.[0-5]\d\.[0-5]\d(\.\d{1,9})? [AaPp][Mm]'
+
+# Variantes Oracle analysées par pd.to_datetime (les fractions de seconde sont ignorées)
+FORMATS_DATE_ORACLE = [
+    '%d-%b-%y %I.%M.%S.%f %p',
+    '%d-%b-%y %I.%M.%S %p',
+    '%d-%b-%y %I:%M:%S %p',
+]
+
+# Autres formats acceptés pour DATE_TRS, essayés dans cet ordre
+FORMATS_DATE_TRS = [
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M',
+    '%m/%d/%Y',
+    '%m/%d/%Y %H:%M:%S',
+]
+
+# Nombre de valeurs examinées pour reconnaître le format dominant d'une colonne
+TAILLE_ECHANTILLON_DATES = 50
+
+
+def _convertir_dates_oracle(texte):
+    """Convertit des dates Oracle à largeur fixe par découpage de colonnes"""
+    # Peu de jours distincts dans un extrait : chaque jour n'est analysé qu'une fois
+    jours = texte.str.slice(0, 9).str.upper()
+    conversions = {
+        jour: pd.to_datetime(jour, format='%d-%b-%y', errors='coerce')
+        for jour in jours.unique()
+    }
+    base = pd.to_datetime(jours.map(conversions))
+    
+    heures = texte.str.slice(10, 12).astype(int) % 12
+    heures += 12 * (texte.str.slice(-2).str.upper() == 'PM')
+    minutes = texte.str.slice(13, 15).astype(int)
+    secondes = texte.str.slice(16, 18).astype(int)
+    return base + pd.to_timedelta(heures * 3600 + minutes * 60 + secondes, unit='s')
+
+
+def normaliser_dates_trs(serie):
+    """
+    Convertit une colonne DATE_TRS en datetime64 de manière vectorisée.
+
+    La famille de formats dominante est reconnue une fois sur un échantillon. Les dates
+    Oracle à largeur fixe sont converties par découpage de colonnes, puis chaque format
+    connu est appliqué en un seul appel à pd.to_datetime(format=...) sur les valeurs
+    encore non converties. Seules les valeurs distinctes restantes passent par
+    l'analyse libre de pandas. Les dates invalides deviennent NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+
+    resultat = pd.Series(pd.NaT, index=serie.index, dtype='datetime64[ns]')
+    texte = serie.astype(str).str.strip()
+    restant = serie.notna() & (texte != '')
+    if not restant.any():
+        return resultat
+
+    # Colonne Oracle : voie rapide, puis variantes Oracle avant les autres formats.
+    # L'ordre de priorité au sein de chaque famille est conservé
+    # (JJ/MM/AAAA avant MM/JJ/AAAA pour les dates ambiguës).
+    echantillon = texte[restant].head(TAILLE_ECHANTILLON_DATES)
+    if echantillon.str.fullmatch(REGEX_DATE_ORACLE).mean() >= 0.5:
+        rapides = restant & texte.str.fullmatch(REGEX_DATE_ORACLE)
+        if rapides.any():
+            resultat[rapides] = _convertir_dates_oracle(texte[rapides])
+            restant &= resultat.isna()
+        formats = FORMATS_DATE_ORACLE + FORMATS_DATE_TRS
+    else:
+        formats = FORMATS_DATE_TRS + FORMATS_DATE_ORACLE
+
+    # Un appel vectorisé par format, uniquement sur les valeurs restantes
+    for fmt in formats:
+        if not restant.any():
+            break
+        converties = pd.to_datetime(texte[restant], format=fmt, errors='coerce')
+        if fmt in FORMATS_DATE_ORACLE:
+            converties = converties.dt.floor('s')
+        valides = converties.notna() & converties.dt.year.between(1900, 2100)
+        resultat[converties.index[valides]] = converties[valides]
+        restant &= resultat.isna()
+
+    # Dernier recours : analyse libre, une seule fois par valeur distincte
+    if restant.any():
+        valeurs = texte[restant]
+        conversions = {
+            valeur: pd.to_datetime(valeur, errors='coerce')
+            for valeur in valeurs.unique()
+        }
+        resultat[valeurs.index] = pd.to_datetime(valeurs.map(conversions), errors='coerce')
+
+    return resultat
+
+
+# Identifiants conservés en texte (zéros en début préservés)
+COLONNES_TEXTE_AGENTS = ['CODE_AGENT', 'ID_TRS', 'CLIENT', 'TEL_CLIENT', 'TYPE_OPERATION']
+
+# Colonnes converties une fois pour toutes en numérique
+COLONNES_NUMERIQUES_AGENTS = ['COMMISSION', 'MONTANT']
+
+
+def preparer_agents(df):
+    """
+    Type le jeu de données agents une seule fois après lecture : DATE_TRS en
+    datetime, COMMISSION/MONTANT numériques et identifiants en texte. Toutes les
+    étapes du rapport consomment ce DataFrame sans le reconvertir.
+    """
+    for col in COLONNES_TEXTE_AGENTS:
+        if col in df.columns:
+            df[col] = df[col].fillna('').astype(str)
+    
+    for col in COLONNES_NUMERIQUES_AGENTS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    
+    if 'DATE_TRS' in df.columns:
+        df['DATE_TRS'] = normaliser_dates_trs(df['DATE_TRS'])
+    
+    return df
+
+
+def lire_fichier_agents(chemin, progression=None):
+    """Lit en flux les seules colonnes utiles du fichier multi-agents puis les type (preparer_agents)"""
+    # LECTURE ULTRA-STRICTE: identifiants forcés en texte cellule par cellule
+    colonnes = {
+        'DATE_TRS': None,
+        'ID_TRS': valeur_texte_ou_vide,
+        'TYPE_OPERATION': None,
+        'TEL_CLIENT': None,
+        'CLIENT': valeur_texte_ou_vide,
+        'COMMISSION': None,
+        'MONTANT': None,
+        'CODE_AGENT': valeur_texte_ou_vide,
+    }
+    return preparer_agents(lire_colonnes_excel(chemin, colonnes, progression))
+
+
+def charger_agents(chemin, journal=None, progression=None):
+    """Charge le fichier multi-agents typé (copie en cache s'il n'a pas changé)"""
+    lecteur = partial(lire_fichier_agents, progression=progression)
+    return charger_avec_cache(chemin, lecteur, 'agents', journal)
+
+
+class GenerateurPDFAgents(GenerateurPDF):
+    """Relevé des transactions et commissions d'un agent"""
+
+    TYPE_RAPPORT = 'agents'
+    COLONNE_GROUPE = 'CODE_AGENT'
+    COLONNE_TOTAL = 'COMMISSION'
+    COLONNE_DATE = 'DATE_TRS'
+    TITRE = "Relevé Agent BANKILY"
+    PREFIXE_ZIP = "Rapports_Multi_Agents"
+    PREFIXE_PDF = "Releve_Agent"
+    LIBELLE = "Agent"
+    # Date, ID, Type, Client centrés ; Commission et Montant à droite
+    ALIGNEMENTS = ['CENTER', 'CENTER', 'CENTER', 'CENTER', 'RIGHT', 'RIGHT']
+    PADDING_TABLEAU = 2
+
+    charger = staticmethod(charger_agents)
+
+    @classmethod
+    def resume_groupe(cls, data):
+        return f"{len(data)} transactions, {data['COMMISSION'].sum():.1f} MRU"
+
+    def add_contenu(self, story, code_agent, agent_data):
+        # Informations agent
+        self.add_agent_info(story, agent_data, code_agent)
+
+        # Tableau des transactions
+        self.add_transactions_table(story, agent_data, code_agent)
+
+    def lignes_info(self, code_agent, df):
+        """Période réelle de l'agent, code agent et totaux (la période est notée au journal)"""
+        # DATE_TRS est déjà converti une seule fois au chargement (preparer_agents)
+        try:
+            nb_invalides = df['DATE_TRS'].isna().sum()
+            if nb_invalides:
+                self.log_message(f"⚠️ Agent {code_agent}: {nb_invalides} date(s) non parsable(s)")
+
+            # Calculer les dates min/max à partir des VRAIES données
+            valid_dates = df['DATE_TRS'].dropna()
+            if len(valid_dates) > 0:
+                date_min = valid_dates.min()
+                date_max = valid_dates.max()
+                date_debut_auto = date_min.strftime("%d/%m/%Y")
+                date_fin_auto = date_max.strftime("%d/%m/%Y")
+                self.log_message(f"📅 Agent {code_agent}: Période réelle du {date_debut_auto} au {date_fin_auto}")
+            else:
+                # Aucune date valide trouvée
+                self.log_message(f"⚠️ Aucune date valide trouvée pour l'agent {code_agent}")
+                self.date_du_jour = True
+                today = datetime.now()
+                date_debut_auto = today.strftime("%d/%m/%Y")
+                date_fin_auto = today.strftime("%d/%m/%Y")
+
+        except Exception as e:
+            self.log_message(f"❌ Erreur traitement dates pour agent {code_agent}: {e}")
+            # En cas d'erreur, utiliser la date actuelle
+            self.date_du_jour = True
+            today = datetime.now()
+            date_debut_auto = today.strftime("%d/%m/%Y")
+            date_fin_auto = today.strftime("%d/%m/%Y")
+
+        # Dates, code agent (affiché en entier), totaux
+        return [
+            ["Date du :", f"{date_debut_auto}   jusqu'au   {date_fin_auto}"],
+            ["Code Agent :", str(code_agent)],
+            ["Total transaction :", f"{len(df)}"],
+            ["Total commission :", formater_nombre(df['COMMISSION'].sum())],
+        ]
+
+    def tableau(self, code_agent, df):
+        # Lignes déjà triées par date au regroupement (analyser_groupes, NaT à la fin)
+        # En-têtes du tableau
+        data = [["Date trs", "ID trs", "Type opération", "Client", "Commission", "Montant"]]
+
+        # Chaque colonne affichée est formatée en une passe, puis assemblée par zip
+        dates = formater_dates(df['DATE_TRS'], '%d/%m/%Y\n%H:%M:%S', vide="Date invalide")
+        # Identifiants et clients déjà en texte : les zéros en début sont préservés
+        ids = colonne_texte(df, 'ID_TRS')
+        types_operation = colonne_texte(df, 'TYPE_OPERATION')
+        clients = colonne_texte(df, 'CLIENT')
+        commissions = formater_nombres(df['COMMISSION'], vide="0") if 'COMMISSION' in df.columns else ["0"] * len(df)
+        montants = formater_nombres(df['MONTANT'], 0, vide="0") if 'MONTANT' in df.columns else ["0"] * len(df)
+
+        data.extend(map(list, zip(dates, ids, types_operation, clients, commissions, montants)))
+
+        # Largeurs optimisées
+        return data, [2.8*cm, 4*cm, 2.8*cm, 2.8*cm, 2.3*cm, 2.3*cm]
+
+    def texte_total(self, data):
+        # Les totaux de l'agent figurent déjà dans les informations
+        return None
+
+    def add_agent_info(self, story, df, code_agent):
+        """Informations de l'agent"""
+        self.add_lignes_info(story, self.lignes_info(code_agent, df))
+
+        story.append(Spacer(1, 20))
+
+    def add_transactions_table(self, story, df, code_agent=None):
+        """Tableau des transactions"""
+        self.add_tableau(story, code_agent, df)
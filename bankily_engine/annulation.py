@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Annulation coopérative des traitements longs (lecture, analyse, génération)
+Le thread de l'interface annule le jeton ; le traitement le vérifie à chaque
+rappel de progression et s'interrompt en levant Annulation.
+"""
+
+import threading
+
+
+class Annulation(Exception):
+    """Traitement interrompu à la demande de l'utilisateur"""
+
+
+class JetonAnnulation:
+    """Demande d'annulation partagée entre l'interface et un traitement en arrière-plan"""
+
+    def __init__(self):
+        self._evenement = threading.Event()
+
+    def annuler(self):
+        self._evenement.set()
+
+    @property
+    def annule(self):
+        return self._evenement.is_set()
+
+    def verifier(self):
+        """Lève Annulation si l'annulation a été demandée"""
+        if self._evenement.is_set():
+            raise Annulation()
+
+    def progression(self, progression=None):
+        """Rappel de progression qui vérifie d'abord l'annulation, puis appelle progression"""
+        def rappel(fraction):
+            self.verifier()
+            if progression:
+                progression(fraction)
+        return rappel
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Parquet des fichiers Excel déjà lus
+Un fichier rouvert sans modification est rechargé depuis sa copie en colonnes
+au lieu de relire le classeur (openpyxl/xlrd)
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+
+import pandas as pd
+
+# pyarrow est optionnel : sans lui, le cache est simplement désactivé
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_OK = True
+except ImportError:
+    PARQUET_OK = False
+
+# Version du format des entrées : à incrémenter si la lecture des fichiers change
+VERSION_CACHE = 3
+
+# Entrées non utilisées depuis plus longtemps que cette durée supprimées
+DUREE_VIE_CACHE_JOURS = 30
+
+# Taille totale maximale du cache (les entrées les moins récentes partent en premier)
+TAILLE_MAX_CACHE = 2 * 1024 ** 3
+
+TAILLE_BLOC_HASH = 1024 * 1024
+
+
+def dossier_application():
+    """Dossier de l'application (exécutable PyInstaller ou scripts Python)"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+DOSSIER_CACHE = os.path.join(dossier_application(), 'cache_excel')
+FICHIER_INDEX = 'index.json'
+
+
+def empreinte_fichier(chemin):
+    """Empreinte SHA-256 du contenu d'un fichier"""
+    sha = hashlib.sha256()
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(TAILLE_BLOC_HASH), b''):
+            sha.update(bloc)
+    return sha.hexdigest()
+
+
+def _lire_index(dossier):
+    try:
+        with open(os.path.join(dossier, FICHIER_INDEX), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _ecrire_index(dossier, index):
+    chemin_tmp = os.path.join(dossier, FICHIER_INDEX + '.tmp')
+    with open(chemin_tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1)
+    os.replace(chemin_tmp, os.path.join(dossier, FICHIER_INDEX))
+
+
+def _supprimer_entrees(dossier, empreinte):
+    """Supprime toutes les variantes mises en cache pour une empreinte"""
+    for nom in os.listdir(dossier):
+        if nom.endswith('.parquet') and empreinte in nom:
+            try:
+                os.remove(os.path.join(dossier, nom))
+            except OSError:
+                pass
+
+
+def empreinte_avec_index(chemin, dossier=DOSSIER_CACHE):
+    """
+    Empreinte du fichier, sans relire son contenu si taille et date de
+    modification n'ont pas changé depuis le dernier passage.
+    Une ancienne version du même fichier est retirée du cache.
+    """
+    chemin_abs = os.path.abspath(chemin)
+    stat = os.stat(chemin_abs)
+    index = _lire_index(dossier)
+    entree = index.get(chemin_abs)
+
+    if entree and entree['taille'] == stat.st_size and entree['mtime'] == stat.st_mtime_ns:
+        return entree['empreinte']
+
+    empreinte = empreinte_fichier(chemin_abs)
+    index[chemin_abs] = {
+        'taille': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'empreinte': empreinte,
+    }
+
+    # L'ancienne version n'est retirée que si aucun autre fichier n'a ce contenu
+    ancienne = entree['empreinte'] if entree else None
+    if ancienne and ancienne != empreinte:
+        if all(e['empreinte'] != ancienne for e in index.values()):
+            _supprimer_entrees(dossier, ancienne)
+
+    _ecrire_index(dossier, index)
+    return empreinte
+
+
+def nettoyer_cache(dossier=DOSSIER_CACHE, duree_vie_jours=DUREE_VIE_CACHE_JOURS,
+                   taille_max=TAILLE_MAX_CACHE):
+    """Évince les entrées périmées puis les plus anciennes au-delà de la taille maximale"""
+    limite = time.time() - duree_vie_jours * 86400
+    entrees = []
+    for nom in os.listdir(dossier):
+        if not nom.endswith('.parquet'):
+            continue
+        chemin = os.path.join(dossier, nom)
+        stat = os.stat(chemin)
+        if stat.st_mtime < limite:
+            os.remove(chemin)
+        else:
+            entrees.append((stat.st_mtime, stat.st_size, chemin))
+
+    taille_totale = sum(taille for _, taille, _ in entrees)
+    for _, taille, chemin in sorted(entrees):
+        if taille_totale <= taille_max:
+            break
+        os.remove(chemin)
+        taille_totale -= taille
+
+
+def charger_avec_cache(chemin, lecteur, variante, journal=None, dossier=DOSSIER_CACHE):
+    """
+    Retourne lecteur(chemin), en réutilisant la copie Parquet de ce fichier si
+    son contenu n'a pas changé. La variante distingue les différentes façons de
+    lire un même fichier (centres, commerçants, agents).
+    Toute erreur du cache est ignorée : on retombe sur la lecture Excel.
+    """
+    journal = journal or (lambda message: None)
+    if not PARQUET_OK:
+        return lecteur(chemin)
+
+    try:
+        os.makedirs(dossier, exist_ok=True)
+        empreinte = empreinte_avec_index(chemin, dossier)
+        chemin_cache = os.path.join(dossier, f"{variante}_v{VERSION_CACHE}_{empreinte}.parquet")
+
+        if os.path.exists(chemin_cache):
+            df = pd.read_parquet(chemin_cache)
+            # Marquer l'entrée comme récemment utilisée
+            os.utime(chemin_cache)
+            journal("⚡ Fichier chargé depuis le cache")
+            return df
+    except Exception as e:
+        journal(f"⚠️ Cache indisponible: {e}")
+        return lecteur(chemin)
+
+    df = lecteur(chemin)
+
+    try:
+        chemin_tmp = chemin_cache + '.tmp'
+        df.to_parquet(chemin_tmp, index=False)
+        os.replace(chemin_tmp, chemin_cache)
+        nettoyer_cache(dossier)
+    except Exception as e:
+        journal(f"⚠️ Mise en cache impossible: {e}")
+        try:
+            os.remove(chemin_tmp)
+        except OSError:
+            pass
+
+    return df
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Cache des PDF déjà rendus, par empreinte de groupe
+Les extractions étant cumulatives, la plupart des groupes sont identiques
+d'un jour à l'autre : un groupe dont les lignes et les réglages de rendu
+(type de rapport, moteur, logos) n'ont pas changé reprend son PDF du cache
+au lieu d'être rendu de nouveau. Les messages du journal émis à son rendu
+(période, dates illisibles...) sont gardés à côté du PDF et réémis.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+
+import pandas as pd
+import reportlab
+
+from bankily_engine.cache import dossier_application, empreinte_fichier
+
+# Version de la mise en page des relevés : à incrémenter si le rendu des PDF change
+VERSION_RENDU = 1
+
+# PDF non réutilisés depuis plus longtemps que cette durée supprimés
+DUREE_VIE_CACHE_PDF_JOURS = 30
+
+# Taille totale maximale du cache (les PDF les moins récemment utilisés partent en premier)
+TAILLE_MAX_CACHE_PDF = 2 * 1024 ** 3
+
+DOSSIER_CACHE_PDF = os.path.join(dossier_application(), 'cache_pdf')
+
+
+def nettoyer_cache_pdf(dossier=DOSSIER_CACHE_PDF, duree_vie_jours=DUREE_VIE_CACHE_PDF_JOURS,
+                       taille_max=TAILLE_MAX_CACHE_PDF):
+    """Évince les PDF périmés puis les moins récemment utilisés au-delà de la taille maximale"""
+    limite = time.time() - duree_vie_jours * 86400
+    entrees = []
+    try:
+        noms = os.listdir(dossier)
+    except OSError:
+        return
+    for nom in noms:
+        chemin = os.path.join(dossier, nom)
+        if nom.endswith('.json'):
+            # Messages d'un PDF déjà évincé
+            if os.path.splitext(nom)[0] + '.pdf' not in noms:
+                _supprimer(chemin)
+            continue
+        if not nom.endswith('.pdf'):
+            continue
+        try:
+            stat = os.stat(chemin)
+        except OSError:
+            continue
+        if stat.st_mtime < limite:
+            _supprimer_entree(chemin)
+        else:
+            entrees.append((stat.st_mtime, stat.st_size, chemin))
+
+    taille_totale = sum(taille for _, taille, _ in entrees)
+    for _, taille, chemin in sorted(entrees):
+        if taille_totale <= taille_max:
+            break
+        _supprimer_entree(chemin)
+        taille_totale -= taille
+
+
+def _supprimer(chemin):
+    try:
+        os.remove(chemin)
+    except OSError:
+        pass
+
+
+def _supprimer_entree(chemin_pdf):
+    """Supprime un PDF du cache et ses messages"""
+    _supprimer(chemin_pdf)
+    _supprimer(os.path.splitext(chemin_pdf)[0] + '.json')
+
+
+class CachePDF:
+    """PDF rendus d'un type de rapport avec des réglages donnés (transmis aux processus de rendu)"""
+
+    def __init__(self, dossier, parametres):
+        self.dossier = dossier
+        # Réglages de rendu communs à tous les groupes, inclus dans chaque empreinte
+        self.parametres = parametres
+
+    @classmethod
+    def pour_generateur(cls, classe, logos=(None, None), moteur=None, dossier=DOSSIER_CACHE_PDF):
+        """Cache des PDF rendus par classe avec ces logos et ce moteur"""
+        os.makedirs(dossier, exist_ok=True)
+        parametres = json.dumps({
+            'version': VERSION_RENDU,
+            'reportlab': reportlab.Version,
+            'classe': f"{classe.__module__}.{classe.__qualname__}",
+            'moteur': moteur or classe.MOTEUR,
+            'logos': [empreinte_fichier(logo) if logo else None for logo in logos],
+        }, sort_keys=True)
+        return cls(dossier, parametres)
+
+    def empreinte(self, nom, data):
+        """Empreinte d'un groupe : réglages, nom, colonnes et valeurs de ses lignes dans l'ordre"""
+        sha = hashlib.sha256(self.parametres.encode('utf-8'))
+        sha.update(repr(nom).encode('utf-8'))
+        sha.update(repr([(str(c), str(t)) for c, t in data.dtypes.items()]).encode('utf-8'))
+        sha.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        return sha.hexdigest()
+
+    def chemin(self, empreinte):
+        return os.path.join(self.dossier, empreinte + '.pdf')
+
+    def chemin_messages(self, empreinte):
+        return os.path.join(self.dossier, empreinte + '.json')
+
+    def lire(self, empreinte):
+        """(contenu du PDF en cache, messages du journal de son rendu), None si absent"""
+        chemin = self.chemin(empreinte)
+        try:
+            with open(chemin, 'rb') as f:
+                contenu = f.read()
+            with open(self.chemin_messages(empreinte), 'r', encoding='utf-8') as f:
+                messages = json.load(f)
+            # Marquer le PDF comme récemment utilisé
+            os.utime(chemin)
+        except (OSError, ValueError):
+            return None
+        return contenu, messages
+
+    def ecrire(self, empreinte, pdf, messages=()):
+        """Met en cache un PDF rendu (contenu en octets, ou chemin du fichier écrit) et ses messages"""
+        chemin = self.chemin(empreinte)
+        chemin_tmp = f"{chemin}.{os.getpid()}.tmp"
+        chemin_messages = self.chemin_messages(empreinte)
+        chemin_messages_tmp = f"{chemin_messages}.{os.getpid()}.tmp"
+        try:
+            # Messages d'abord : un PDF en cache a toujours les siens
+            with open(chemin_messages_tmp, 'w', encoding='utf-8') as f:
+                json.dump(list(messages), f, ensure_ascii=False)
+            os.replace(chemin_messages_tmp, chemin_messages)
+            if isinstance(pdf, bytes):
+                with open(chemin_tmp, 'wb') as f:
+                    f.write(pdf)
+            else:
+                shutil.copyfile(pdf, chemin_tmp)
+            os.replace(chemin_tmp, chemin)
+        except OSError:
+            _supprimer(chemin_messages_tmp)
+            _supprimer(chemin_tmp)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports multi-centres : lecture du fichier Excel et relevé PDF par centre
+"""
+
+from functools import partial
+
+from reportlab.platypus import Spacer, Table, TableStyle
+from reportlab.lib.units import cm
+
+from bankily_engine.cache import charger_avec_cache
+from bankily_engine.ingestion import convertir_dates, lire_colonnes_excel, valeur_texte
+from bankily_engine.rapport import (
+    GenerateurPDF, formater_nombre, lignes_releve_credit
+)
+
+
+def lire_fichier_centres(chemin, progression=None):
+    """Lit en flux les seules colonnes utiles du fichier Excel multi-centres (ID conservés en texte, DATEP en dates)"""
+    colonnes = {
+        'ID': valeur_texte,
+        'DATEP': None,
+        'CLIENT': None,
+        'MONTANT': None,
+        'CENTRE': None,
+    }
+    df = lire_colonnes_excel(chemin, colonnes, progression)
+    if 'DATEP' in df.columns:
+        df['DATEP'] = convertir_dates(df['DATEP'])
+    return df
+
+
+def charger_centres(chemin, journal=None, progression=None):
+    """Charge le fichier multi-centres (copie en cache s'il n'a pas changé), ID en texte"""
+    lecteur = partial(lire_fichier_centres, progression=progression)
+    df = charger_avec_cache(chemin, lecteur, 'centres', journal)
+    if 'ID' in df.columns:
+        df['ID'] = df['ID'].astype(str)  # S'assurer que les ID restent des strings
+    return df
+
+
+# Lignes d'information du relevé de centre (construit une fois, partagé par tous les centres)
+STYLE_INFO_CENTRE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+])
+
+
+class GenerateurPDFCentres(GenerateurPDF):
+    """Relevé de paiement d'un centre"""
+
+    TYPE_RAPPORT = 'centres'
+    COLONNE_GROUPE = 'CENTRE'
+    COLONNE_DATE = 'DATEP'
+    DATES_DECROISSANTES = True
+    TITRE = "Relevé de paiement commerçant BANKILY"
+    PREFIXE_ZIP = "Rapports_Multi_Centres"
+    # ID, Date, Client, Centre centrés, Montant à droite
+    ALIGNEMENTS = ['CENTER', 'CENTER', 'CENTER', 'CENTER', 'RIGHT']
+
+    charger = staticmethod(charger_centres)
+
+    def add_contenu(self, story, centre_nom, centre_data):
+        # Tableau
+        self.add_table(story, centre_data, centre_nom)
+
+        # Résumé
+        self.add_summary(story, centre_data)
+
+    def periode(self, df):
+        """Dates de début et de fin du centre (DATEP typé au chargement)"""
+        return df['DATEP'].min().strftime("%d/%m/%Y"), df['DATEP'].max().strftime("%d/%m/%Y")
+
+    def lignes_info(self, centre_nom, df):
+        date_debut_auto, date_fin_auto = self.periode(df)
+        total_montant = formater_nombre(df['MONTANT'].sum())
+        return [
+            ["Nom du centre :", centre_nom],
+            ["Date du :", f"{date_debut_auto}   jusqu'au :   {date_fin_auto}"],
+            ["No du compte :", "2000009"],
+            ["Total crédit :", f"{total_montant} MRU"],
+            ["Total paiement :", f"{total_montant} MRU"],
+        ]
+
+    def tableau(self, centre_nom, df):
+        # Tableau avec largeurs équilibrées pour éviter chevauchements
+        lignes = lignes_releve_credit(df, centre_nom, "Centre")
+        return lignes, [3.8*cm, 3.2*cm, 2.8*cm, 3.2*cm, 3*cm]
+
+    def add_table(self, story, df, centre_nom):
+        """Tableau style BANKILY"""
+        # Dates calculées automatiquement à partir des données du centre
+        date_debut_auto, date_fin_auto = self.periode(df)
+
+        # Infos avec dates automatiques du centre
+        style_commun = STYLE_INFO_CENTRE
+
+        # Première ligne - nom du centre
+        info1 = [["Nom du centre :", centre_nom]]
+        table1 = Table(info1, colWidths=[3.5*cm, 12.5*cm])
+        table1.setStyle(style_commun)
+        story.append(table1)
+
+        # Deuxième ligne - dates automatiques du centre
+        info2 = [["Date du :", date_debut_auto, "jusqu'au :", date_fin_auto]]
+        table2 = Table(info2, colWidths=[3.5*cm, 3*cm, 2.5*cm, 7*cm])
+        table2.setStyle(style_commun)
+        story.append(table2)
+
+        # Troisième ligne - numéro de compte
+        info3 = [["No du compte :", "2000009"]]
+        table3 = Table(info3, colWidths=[3.5*cm, 12.5*cm])
+        table3.setStyle(style_commun)
+        story.append(table3)
+
+        story.append(Spacer(1, 15))
+
+        # Totaux
+        total_montant = formater_nombre(df['MONTANT'].sum())
+
+        for ligne in [["Total crédit :", f"{total_montant} MRU"],
+                      ["Total paiement :", f"{total_montant} MRU"]]:
+            table = Table([ligne], colWidths=[4*cm, 12*cm])
+            table.setStyle(style_commun)
+            story.append(table)
+
+        story.append(Spacer(1, 20))
+
+        # Tableau principal avec colonnes uniformes
+        self.add_tableau(story, centre_nom, df)
+        story.append(Spacer(1, 20))
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Génération des rapports en ligne de commande, sans interface graphique
+(tâches planifiées sur serveur). N'importe pas Tkinter.
+
+    python -m bankily_engine centres fichier.xlsx --sortie rapports.zip
+    python -m bankily_engine agents fichier.xlsx --sortie dossier_pdf --processus 4
+
+Une génération interrompue (coupure, erreur) est reprise à la relance sur le
+même fichier : seuls les groupes manquants sont rendus (--sans-reprise pour
+tout refaire). Les groupes inchangés depuis une génération précédente sont
+repris du cache des PDF au lieu d'être rendus (--sans-cache-pdf pour tout rendre).
+
+Code de retour : 0 si tous les rapports sont générés, 1 sinon.
+"""
+
+import os
+import sys
+import argparse
+import multiprocessing
+from datetime import datetime
+
+from bankily_engine.agents import GenerateurPDFAgents
+from bankily_engine.centres import GenerateurPDFCentres
+from bankily_engine.commercants import GenerateurPDFCommercants
+from bankily_engine.cache import dossier_application
+from bankily_engine.cache_pdf import DOSSIER_CACHE_PDF
+from bankily_engine.generation import FichierInvalide, analyser_fichier, generer_sortie
+from bankily_engine.rapport import COMPRESSION_ZIP_DEFAUT, COMPRESSIONS_ZIP, MOTEURS, nom_zip
+from bankily_engine.reprise import Reprise
+
+# Type de rapport (sous-commande) : spécification du rapport
+TYPES_RAPPORT = {
+    classe.TYPE_RAPPORT: classe
+    for classe in (GenerateurPDFCentres, GenerateurPDFCommercants, GenerateurPDFAgents)
+}
+
+NB_PROCESSUS_DEFAUT = max(1, (os.cpu_count() or 1) - 1)
+
+
+def journal(message):
+    """Journal horodaté sur la sortie standard"""
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+def logo_par_defaut(nom):
+    """Logo du dossier assets/ de l'application s'il existe"""
+    chemin = os.path.join(dossier_application(), 'assets', nom)
+    return chemin if os.path.exists(chemin) else None
+
+
+def generer(type_rapport, fichier, sortie=None, nb_processus=1, logo_bpm=None, logo_bankily=None,
+            moteur=None, compression=COMPRESSION_ZIP_DEFAUT, reprendre=True, cache_pdf=DOSSIER_CACHE_PDF):
+    """
+    Lit le fichier, regroupe les transactions et rend un PDF par groupe.
+    sortie : chemin se terminant par .zip (archive) ou dossier recevant les PDF
+    (None : sortie de la génération interrompue à reprendre, sinon archive horodatée).
+    reprendre : reprend la génération interrompue de ce fichier si sortie est
+    la même (voir bankily_engine.reprise) ; False : tout est refait.
+    cache_pdf : dossier du cache des PDF rendus (voir bankily_engine.cache_pdf, None : sans cache).
+    moteur : 'platypus', 'pages' ou 'canvas' (défaut : celui du type de rapport).
+    compression : compression des PDF dans l'archive (voir COMPRESSIONS_ZIP).
+    Les mesures de la génération sont résumées dans le journal et écrites en
+    JSON à côté de la sortie (voir bankily_engine.generation.generer_sortie).
+    Renvoie le code de retour (0 si tous les PDF sont générés).
+    """
+    classe = TYPES_RAPPORT[type_rapport]
+
+    journal(f"🔍 Lecture de {os.path.basename(fichier)}")
+    try:
+        mesures, _, groupes, df = analyser_fichier(classe, fichier, journal)
+    except FichierInvalide as e:
+        journal(f"❌ {e}")
+        return 1
+    if not groupes:
+        journal("❌ Aucune transaction à traiter")
+        return 1
+    journal(f"✅ {len(groupes)} groupes | {len(df)} transactions total")
+
+    # Génération interrompue de ce fichier : reprise dans la même sortie
+    reprise = Reprise.pour_fichier(type_rapport, fichier)
+    reprendre = reprendre and reprise.interrompue and (
+        sortie is None or os.path.abspath(sortie) == reprise.sortie
+    )
+    if reprendre:
+        sortie = reprise.sortie
+        journal(f"♻️ Génération interrompue trouvée ({len(reprise.termines)} rapports déjà produits)")
+    sortie = sortie or nom_zip(classe)
+
+    pdf_files, echecs = generer_sortie(
+        classe, groupes, sortie, fichier,
+        logos=(logo_bpm, logo_bankily),
+        nb_processus=nb_processus,
+        journal=journal,
+        moteur=moteur,
+        compression=compression,
+        mesures=mesures,
+        reprise=reprise,
+        reprendre=reprendre,
+        cache_pdf=cache_pdf
+    )
+    return 0 if pdf_files and not echecs else 1
+
+
+def creer_parser():
+    parser = argparse.ArgumentParser(
+        prog='bankily_engine',
+        description="Génération des rapports PDF BANKILY sans interface graphique"
+    )
+    sous_commandes = parser.add_subparsers(dest='type_rapport', required=True)
+    for type_rapport, classe in TYPES_RAPPORT.items():
+        sous = sous_commandes.add_parser(type_rapport, help=f"Rapports multi-{type_rapport}")
+        sous.add_argument('fichier', help="Fichier Excel (.xlsx ou .xls)")
+        sous.add_argument(
+            '--sortie',
+            help=f"Archive .zip ou dossier des PDF (défaut : {classe.PREFIXE_ZIP}_<date>.zip)"
+        )
+        sous.add_argument('--processus', type=int, default=NB_PROCESSUS_DEFAUT,
+                          help=f"Processus de rendu (défaut : {NB_PROCESSUS_DEFAUT})")
+        sous.add_argument('--logo-bpm', default=logo_par_defaut('bpm.png'),
+                          help="Logo BPM (défaut : assets/bpm.png)")
+        sous.add_argument('--logo-bankily', default=logo_par_defaut('bankily.png'),
+                          help="Logo BANKILY (défaut : assets/bankily.png)")
+        sous.add_argument('--moteur', choices=MOTEURS,
+                          help=f"Moteur de rendu PDF (défaut : {classe.MOTEUR} ; "
+                               "pages ou canvas pour les relevés très volumineux)")
+        sous.add_argument('--compression', choices=list(COMPRESSIONS_ZIP), default=COMPRESSION_ZIP_DEFAUT,
+                          help="Compression des PDF dans l'archive .zip (défaut : auto, deflate "
+                               "rapide seulement si le fichier y gagne)")
+        sous.add_argument('--sans-reprise', action='store_true',
+                          help="Refait tous les rapports même si une génération de ce fichier a été interrompue")
+        sous.add_argument('--sans-cache-pdf', action='store_true',
+                          help="Rend tous les PDF, sans reprendre ceux des groupes inchangés (cache_pdf/)")
+    return parser
+
+
+def main(argv=None):
+    args = creer_parser().parse_args(argv)
+
+    if not os.path.exists(args.fichier):
+        journal(f"❌ Fichier introuvable: {args.fichier}")
+        return 1
+    for logo in (args.logo_bpm, args.logo_bankily):
+        if logo and not os.path.exists(logo):
+            journal(f"❌ Logo introuvable: {logo}")
+            return 1
+
+    try:
+        return generer(args.type_rapport, args.fichier, args.sortie, max(1, args.processus),
+                       args.logo_bpm, args.logo_bankily, args.moteur, args.compression,
+                       reprendre=not args.sans_reprise,
+                       cache_pdf=None if args.sans_cache_pdf else DOSSIER_CACHE_PDF)
+    except Exception as e:
+        journal(f"❌ Erreur globale: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
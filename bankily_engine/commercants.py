@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports multi-commerçants : lecture du fichier Excel et relevé PDF par commerçant
+"""
+
+from functools import partial
+
+from reportlab.platypus import Spacer
+from reportlab.lib.units import cm
+
+from bankily_engine.cache import charger_avec_cache
+from bankily_engine.ingestion import convertir_dates, lire_colonnes_excel, valeur_texte
+from bankily_engine.rapport import (
+    GenerateurPDF, formater_nombre, lignes_releve_credit
+)
+
+
+def lire_fichier_commercants(chemin, progression=None):
+    """Lit en flux les seules colonnes utiles du fichier Excel multi-commerçants (ID conservés en texte, DATEP en dates)"""
+    colonnes = {
+        'ID': valeur_texte,
+        'DATEP': None,
+        'CLIENT': None,
+        'MONTANT': None,
+        'COMMERCANT': None,
+    }
+    df = lire_colonnes_excel(chemin, colonnes, progression)
+    if 'DATEP' in df.columns:
+        df['DATEP'] = convertir_dates(df['DATEP'])
+    return df
+
+
+def charger_commercants(chemin, journal=None, progression=None):
+    """Charge le fichier multi-commerçants (copie en cache s'il n'a pas changé), ID en texte"""
+    lecteur = partial(lire_fichier_commercants, progression=progression)
+    df = charger_avec_cache(chemin, lecteur, 'commercants', journal)
+    if 'ID' in df.columns:
+        df['ID'] = df['ID'].astype(str)  # S'assurer que les ID restent des strings
+    return df
+
+
+class GenerateurPDFCommercants(GenerateurPDF):
+    """Relevé de paiement d'un commerçant"""
+
+    TYPE_RAPPORT = 'commercants'
+    COLONNE_GROUPE = 'COMMERCANT'
+    COLONNE_DATE = 'DATEP'
+    DATES_DECROISSANTES = True
+    TITRE = "Relevé de paiement commerçant BANKILY"
+    PREFIXE_ZIP = "Rapports_Multi_Commercants"
+
+    # Commerçant aligné à gauche, seule colonne avec retour à la ligne
+    ALIGNEMENTS = ['CENTER', 'CENTER', 'CENTER', 'LEFT', 'RIGHT']
+    PADDING_TABLEAU = 2
+    WORDWRAP_TABLEAU = ((3, 1), (3, -1))
+
+    charger = staticmethod(charger_commercants)
+
+    def add_contenu(self, story, commercant_nom, commercant_data):
+        # Tableau
+        self.add_table(story, commercant_data, commercant_nom)
+
+        # Résumé
+        self.add_summary(story, commercant_data)
+
+    def lignes_info(self, commercant_nom, df):
+        """Nom du commerçant complet, dates, nombre et montant des transactions"""
+        # Calculer les dates automatiquement à partir des données du commerçant (DATEP typé au chargement)
+        date_debut_auto = df['DATEP'].min().strftime("%d/%m/%Y")
+        date_fin_auto = df['DATEP'].max().strftime("%d/%m/%Y")
+
+        return [
+            ["Nom du commerçant :", commercant_nom],
+            ["Date du :", f"{date_debut_auto}   jusqu'au   {date_fin_auto}"],
+            ["Total transactions :", f"{len(df)}"],
+            ["Total paiement :", f"{formater_nombre(df['MONTANT'].sum())} MRU"],
+        ]
+
+    def tableau(self, commercant_nom, df):
+        # Nom du commerçant complet dans chaque ligne
+        lignes = lignes_releve_credit(df, commercant_nom, "Commerçant")
+        # Largeurs optimisées pour noms longs sans coupure
+        return lignes, [3.8*cm, 3.2*cm, 2.5*cm, 4.5*cm, 3*cm]
+
+    def add_table(self, story, df, commercant_nom):
+        """Tableau style BANKILY - VERSION CORRIGÉE ALIGNEMENT"""
+        self.add_lignes_info(story, self.lignes_info(commercant_nom, df))
+
+        story.append(Spacer(1, 20))
+
+        # Tableau principal
+        self.add_tableau(story, commercant_nom, df)
+        story.append(Spacer(1, 20))
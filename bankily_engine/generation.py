@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Chaîne d'une génération, commune aux interfaces et à la ligne de commande :
+lecture et regroupement du fichier Excel (analyser_fichier), puis rendu des
+PDF dans la sortie avec manifeste de reprise, mesures et rapport JSON
+(generer_sortie). N'importe pas Tkinter.
+"""
+
+import os
+
+from bankily_engine.cache_pdf import DOSSIER_CACHE_PDF
+from bankily_engine.mesures import Mesures, chemin_rapport
+from bankily_engine.rapport import COMPRESSION_ZIP_DEFAUT, ArchiveZip, generer_rapports
+
+
+class FichierInvalide(ValueError):
+    """Fichier Excel sans la colonne de regroupement du type de rapport"""
+
+
+def analyser_fichier(classe, fichier, journal=None, progression=None, annulation=None):
+    """
+    Lit le fichier (ou sa copie en cache) et regroupe ses transactions.
+    annulation (bankily_engine.annulation.JetonAnnulation) est vérifié après
+    chaque étape. Renvoie (mesures du chargement et de l'analyse, résumé par
+    groupe, GroupesTransactions, DataFrame lu).
+    """
+    mesures = Mesures()
+    with mesures.etape('chargement'):
+        df = classe.charger(fichier, journal, progression)
+    if annulation is not None:
+        annulation.verifier()
+
+    if classe.COLONNE_GROUPE not in df.columns:
+        raise FichierInvalide(f"La colonne '{classe.COLONNE_GROUPE}' est introuvable dans le fichier Excel")
+
+    # Nombre et total par groupe en un seul groupby, lignes triées par date en plages contiguës
+    with mesures.etape('analyse'):
+        resume, groupes = classe.analyser(df)
+    if annulation is not None:
+        annulation.verifier()
+    return mesures, resume, groupes, df
+
+
+def generer_sortie(classe, groupes, sortie, fichier, logos=(None, None), nb_processus=1,
+                   journal=None, progression=None, moteur=None, compression=COMPRESSION_ZIP_DEFAUT,
+                   mesures=None, annulation=None, reprise=None, reprendre=False,
+                   cache_pdf=DOSSIER_CACHE_PDF, **contexte):
+    """
+    Rend un PDF par groupe dans sortie (chemin .zip : archive remplie au fil
+    du rendu ; sinon dossier), puis résume les mesures au journal et les écrit
+    en JSON à côté de la sortie (contexte : champs ajoutés au rapport).
+    reprise (bankily_engine.reprise.Reprise, None : sans manifeste) ouvre la
+    sortie en gardant les PDF de la génération interrompue si reprendre ; son
+    manifeste est supprimé si tout est produit, gardé pour reprendre sinon.
+    Les autres paramètres sont ceux de generer_rapports.
+    Renvoie (PDF produits, nombre d'échecs).
+    """
+    journal = journal or (lambda message: None)
+    mesures = mesures if mesures is not None else Mesures()
+
+    vers_zip = sortie.lower().endswith('.zip')
+    if vers_zip:
+        # Chaque PDF est ajouté à l'archive dès qu'il est rendu (sans fichier temporaire)
+        os.makedirs(os.path.dirname(os.path.abspath(sortie)), exist_ok=True)
+        journal(f"📦 Archive ZIP: {sortie}")
+    if reprise is not None:
+        # PDF notés au fil de l'eau dans le manifeste de reprise
+        destination = reprise.ouvrir(sortie, reprendre, compression, journal)
+    elif vers_zip:
+        destination = ArchiveZip(sortie, compression)
+    else:
+        os.makedirs(sortie, exist_ok=True)
+        destination = sortie
+
+    try:
+        with mesures.etape('generation'):
+            pdf_files, echecs = generer_rapports(
+                classe, groupes, destination,
+                logos=logos,
+                nb_processus=nb_processus,
+                journal=journal,
+                progression=progression,
+                moteur=moteur,
+                mesures=mesures,
+                annulation=annulation,
+                reprise=reprise,
+                cache_pdf=cache_pdf
+            )
+        arretee = annulation is not None and annulation.annule
+        if reprise is not None:
+            reprise.terminer(complete=not echecs and not arretee)
+    finally:
+        if vers_zip:
+            with mesures.etape('fermeture_zip'):
+                destination.fermer()
+
+    # Récapitulatif des durées dans le journal, rapport JSON à côté de la sortie
+    for ligne in mesures.resume():
+        journal(ligne)
+    if not pdf_files:
+        # Ni archive vide ni rapport JSON orphelin
+        if vers_zip:
+            os.remove(sortie)
+        journal("❌ Aucun PDF généré")
+        if echecs:
+            journal(f"⚠️ {echecs} rapport(s) en échec")
+        return pdf_files, echecs
+
+    rapport_json = mesures.enregistrer(
+        chemin_rapport(sortie),
+        type_rapport=classe.TYPE_RAPPORT,
+        fichier=os.path.abspath(fichier),
+        sortie=os.path.abspath(sortie),
+        moteur=moteur or classe.MOTEUR,
+        processus=nb_processus,
+        compression=compression if vers_zip else None,
+        reprise=reprendre,
+        taille_archive=os.path.getsize(sortie) if vers_zip else None,
+        arretee=arretee,
+        **contexte
+    )
+    journal(f"📊 Mesures: {rapport_json}")
+
+    if arretee:
+        journal(f"⏹️ Sortie partielle: {sortie} ({len(pdf_files)} rapports, génération arrêtée, reprise possible)")
+    elif vers_zip:
+        journal(f"🎉 ZIP créé: {sortie} ({len(pdf_files)} rapports)")
+    else:
+        journal(f"🎉 {len(pdf_files)} rapports dans {sortie}")
+    if echecs:
+        journal(f"⚠️ {echecs} rapport(s) en échec")
+    return pdf_files, echecs
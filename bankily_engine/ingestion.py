@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Lecture en flux des fichiers Excel, limitée aux colonnes utiles
+.xlsx via openpyxl en lecture seule, .xls via xlrd (feuilles chargées à la demande)
+"""
+
+import pandas as pd
+
+# Fréquence des appels de progression (en lignes lues)
+INTERVALLE_PROGRESSION = 5000
+
+
+def valeur_texte(valeur, vide=None):
+    """Convertit une cellule en texte sans perdre les zéros ni passer en notation scientifique"""
+    if valeur is None or valeur == '':
+        return vide
+    if isinstance(valeur, float) and valeur.is_integer():
+        return str(int(valeur))
+    return str(valeur)
+
+
+def valeur_texte_ou_vide(valeur):
+    """Comme valeur_texte, une cellule vide devient une chaîne vide"""
+    return valeur_texte(valeur, '')
+
+
+def convertir_dates(serie):
+    """Colonne de dates typée une fois au chargement (formats hétérogènes acceptés, sinon NaT)"""
+    try:
+        return pd.to_datetime(serie)
+    except (ValueError, TypeError):
+        return pd.to_datetime(serie, format='mixed', errors='coerce')
+
+
+def _positions_colonnes(entete, colonnes):
+    """Position dans le fichier de chaque colonne demandée (première occurrence)"""
+    positions = {}
+    for i, nom in enumerate(entete):
+        if nom in colonnes and nom not in positions:
+            positions[nom] = i
+    return positions
+
+
+def _lire_xlsx(chemin, colonnes, progression):
+    import openpyxl
+
+    classeur = openpyxl.load_workbook(chemin, read_only=True, data_only=True)
+    try:
+        feuille = classeur.worksheets[0]
+        entete = next(feuille.iter_rows(max_row=1, values_only=True), ())
+        positions = _positions_colonnes(entete, colonnes)
+        valeurs = {nom: [] for nom in positions}
+        if not positions:
+            return valeurs
+
+        # Chaque colonne utile : (liste de sortie, position, convertisseur)
+        extraits = [(valeurs[nom], i, colonnes[nom]) for nom, i in positions.items()]
+        total = max((feuille.max_row or 0) - 1, 1)
+
+        lignes = feuille.iter_rows(
+            min_row=2,
+            max_col=max(positions.values()) + 1,
+            values_only=True
+        )
+        for n, ligne in enumerate(lignes, 1):
+            cellules = [ligne[i] if i < len(ligne) else None for _, i, _ in extraits]
+            # Lignes vides ignorées comme avec pd.read_excel
+            if all(c is None for c in cellules):
+                continue
+            for (sortie, _, convertir), cellule in zip(extraits, cellules):
+                sortie.append(convertir(cellule) if convertir else cellule)
+
+            if progression and n % INTERVALLE_PROGRESSION == 0:
+                progression(min(n / total, 1.0))
+
+        return valeurs
+    finally:
+        classeur.close()
+
+
+def _lire_xls(chemin, colonnes, progression):
+    import xlrd
+
+    livre = xlrd.open_workbook(chemin, on_demand=True)
+    try:
+        feuille = livre.sheet_by_index(0)
+        entete = feuille.row_values(0) if feuille.nrows else []
+        positions = _positions_colonnes(entete, colonnes)
+        valeurs = {}
+
+        for k, (nom, i) in enumerate(positions.items()):
+            convertir = colonnes[nom]
+            cellules = []
+            for type_cellule, cellule in zip(feuille.col_types(i, start_rowx=1),
+                                             feuille.col_values(i, start_rowx=1)):
+                if type_cellule in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+                    cellule = None
+                elif type_cellule == xlrd.XL_CELL_DATE:
+                    cellule = xlrd.xldate.xldate_as_datetime(cellule, livre.datemode)
+                elif type_cellule == xlrd.XL_CELL_NUMBER and cellule.is_integer():
+                    cellule = int(cellule)
+                elif type_cellule == xlrd.XL_CELL_BOOLEAN:
+                    cellule = bool(cellule)
+                elif type_cellule == xlrd.XL_CELL_ERROR:
+                    cellule = None
+                cellules.append(cellule)
+            valeurs[nom] = cellules
+
+            if progression:
+                progression((k + 1) / len(positions))
+
+        # Lignes vides ignorées comme avec pd.read_excel
+        if valeurs:
+            lignes_pleines = [
+                any(cellule is not None for cellule in ligne)
+                for ligne in zip(*valeurs.values())
+            ]
+            for nom, cellules in valeurs.items():
+                convertir = colonnes[nom]
+                valeurs[nom] = [
+                    convertir(cellule) if convertir else cellule
+                    for cellule, garder in zip(cellules, lignes_pleines) if garder
+                ]
+
+        return valeurs
+    finally:
+        livre.release_resources()
+
+
+def lire_colonnes_excel(chemin, colonnes, progression=None):
+    """
+    Lit la première feuille d'un fichier Excel en ne gardant que les colonnes demandées.
+
+    colonnes : {nom: convertisseur} ; le convertisseur est appliqué à chaque cellule
+    au fil de la lecture (None garde la valeur brute). Les colonnes absentes du fichier
+    sont ignorées. progression : fonction appelée avec la fraction lue (0 à 1).
+    """
+    if chemin.lower().endswith('.xls'):
+        valeurs = _lire_xls(chemin, colonnes, progression)
+    else:
+        valeurs = _lire_xlsx(chemin, colonnes, progression)
+
+    if progression:
+        progression(1.0)
+    return pd.DataFrame(valeurs)
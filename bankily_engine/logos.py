@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Logos de l'en-tête des relevés, préparés une fois par génération
+Chaque logo est décodé une seule fois et réduit à sa taille imprimée : les
+PDF du lot le dessinent depuis la mémoire (canvas.drawImage), sans relire ni
+redécoder le PNG ; reportlab ne l'intègre qu'une fois par document.
+"""
+
+import os
+
+from PIL import Image as ImagePIL
+from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+# Taille imprimée des logos (cadre de 3 x 2 cm, logo BPM proportionnel)
+LARGEUR_LOGO = 3*cm
+HAUTEUR_LOGO = 2*cm
+
+# Résolution d'impression visée : au-delà, les pixels sont perdus dans le PDF
+RESOLUTION_LOGO = 300
+
+
+def taille_imprimee(largeur_px, hauteur_px, proportionnel):
+    """Taille en points d'un logo dans le cadre LARGEUR_LOGO x HAUTEUR_LOGO"""
+    if not proportionnel:
+        return LARGEUR_LOGO, HAUTEUR_LOGO
+    echelle = min(LARGEUR_LOGO / largeur_px, HAUTEUR_LOGO / hauteur_px)
+    return largeur_px * echelle, hauteur_px * echelle
+
+
+class LogoPrepare:
+    """Logo décodé et réduit une fois, dessinable sur n'importe quel canvas"""
+
+    def __init__(self, chemin, proportionnel=False):
+        with ImagePIL.open(chemin) as image:
+            image.load()
+        # Palette : convertie en RGB(A) une fois pour toutes (transparence conservée)
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            transparent = image.mode in ('LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if transparent else 'RGB')
+
+        self.largeur, self.hauteur = taille_imprimee(image.width, image.height, proportionnel)
+        cible = (round(self.largeur / 72 * RESOLUTION_LOGO), round(self.hauteur / 72 * RESOLUTION_LOGO))
+        # Jamais d'agrandissement : seuls les axes trop fins sont réduits
+        cible = (min(cible[0], image.width), min(cible[1], image.height))
+        if cible != image.size:
+            image = image.resize(cible, ImagePIL.LANCZOS)
+
+        self.image = ImageReader(image)
+
+    def dessiner(self, c, x, y, largeur=None, hauteur=None):
+        """Dessine le logo, coin inférieur gauche en (x, y), à sa taille imprimée par défaut"""
+        c.drawImage(self.image, x, y, largeur or self.largeur, hauteur or self.hauteur, mask='auto')
+
+
+def preparer_logos(logo_bpm, logo_bankily):
+    """Logos BPM (proportionnel) et BANKILY prêts à dessiner, None si l'un des deux manque"""
+    if not (logo_bpm and os.path.exists(logo_bpm) and logo_bankily and os.path.exists(logo_bankily)):
+        return None
+    return LogoPrepare(logo_bpm, proportionnel=True), LogoPrepare(logo_bankily)
+
+
+class Logo(Flowable):
+    """Logo préparé placé dans le flux platypus"""
+
+    def __init__(self, logo):
+        super().__init__()
+        self.logo = logo
+        self.drawWidth = logo.largeur
+        self.drawHeight = logo.hauteur
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.logo.dessiner(self.canv, 0, 0)
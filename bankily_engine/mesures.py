@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Mesures d'une génération : durée de chaque étape (chargement, analyse,
+génération des PDF, écriture de l'archive) et de chaque groupe (lignes,
+construction du relevé, rendu reportlab, pages, octets). Résumées dans le
+journal en fin de génération et enregistrées en JSON à côté de l'archive.
+"""
+
+import os
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Libellés des étapes dans le journal (ordre d'affichage)
+LIBELLES_ETAPES = {
+    'chargement': "Chargement Excel/cache",
+    'analyse': "Analyse des groupes",
+    'generation': "Génération des PDF",
+    'ecriture_zip': "  dont écriture ZIP",
+    'fermeture_zip': "Fermeture ZIP",
+}
+
+# Groupes les plus lents cités dans le résumé du journal
+NB_GROUPES_LENTS = 3
+
+
+def chemin_rapport(sortie):
+    """Rapport JSON d'une génération : à côté de l'archive ou du dossier des PDF"""
+    base = os.path.normpath(sortie)
+    if base.lower().endswith('.zip'):
+        base = base[:-4]
+    return base + "_mesures.json"
+
+
+class Mesures:
+    """Chronométrage des étapes d'une génération et mesures par groupe"""
+
+    def __init__(self, etapes=None):
+        self.debut = datetime.now()
+        # Étape : durée cumulée en secondes (etapes : mesures reprises d'une analyse)
+        self.etapes = dict(etapes or {})
+        # Une entrée par groupe rendu (voir generer_pdf_worker)
+        self.groupes = []
+
+    @contextmanager
+    def etape(self, nom):
+        """Chronomètre un bloc ; les durées d'une même étape s'additionnent"""
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.ajouter_duree(nom, time.perf_counter() - debut)
+
+    def ajouter_duree(self, nom, duree):
+        self.etapes[nom] = self.etapes.get(nom, 0.0) + duree
+
+    def ajouter_groupe(self, nom, mesure):
+        """Mesures d'un groupe renvoyées par le processus de rendu"""
+        self.groupes.append({'groupe': str(nom), **mesure})
+
+    def totaux(self):
+        """Sommes sur les groupes (durées cumulées sur tous les processus)"""
+        totaux = {'groupes': len(self.groupes), 'echecs': 0, 'sautes': 0, 'repris': 0, 'cache': 0,
+                  'lignes': 0, 'pages': 0, 'octets': 0, 'construction': 0.0, 'rendu': 0.0, 'duree': 0.0}
+        for groupe in self.groupes:
+            # Groupe sauté après une demande d'arrêt : ni rendu, ni en échec, ni compté
+            if groupe.get('saute'):
+                totaux['sautes'] += 1
+                continue
+            # PDF gardé d'une génération interrompue : pas rendu cette fois
+            if groupe.get('repris'):
+                totaux['repris'] += 1
+                continue
+            totaux['echecs'] += not groupe.get('ok', True)
+            # PDF repris du cache : copié, pas rendu (pages non comptées)
+            totaux['cache'] += bool(groupe.get('cache'))
+            for cle in ('lignes', 'pages', 'octets', 'construction', 'rendu', 'duree'):
+                totaux[cle] += groupe.get(cle, 0)
+        return totaux
+
+    def resume(self):
+        """Lignes du tableau récapitulatif pour le journal"""
+        lignes = ["📊 Mesures de la génération"]
+        etapes = [e for e in LIBELLES_ETAPES if e in self.etapes]
+        etapes += [e for e in self.etapes if e not in LIBELLES_ETAPES]
+        for etape in etapes:
+            lignes.append(f"   {LIBELLES_ETAPES.get(etape, etape):<24}{self.etapes[etape]:>9.2f} s")
+
+        if self.groupes:
+            t = self.totaux()
+            sautes = f", {t['sautes']} sauté(s)" if t['sautes'] else ""
+            sautes += f", {t['repris']} repris" if t['repris'] else ""
+            sautes += f", {t['cache']} depuis le cache" if t['cache'] else ""
+            lignes.append(
+                f"   Groupes: {t['groupes']} ({t['echecs']} échec(s){sautes}) | {t['lignes']} lignes | "
+                f"{t['pages']} pages{' rendues' if t['cache'] else ''} | {t['octets'] / 1024 / 1024:.1f} Mo"
+            )
+            lignes.append(
+                f"   Par groupe (cumul des processus): construction {t['construction']:.2f} s | "
+                f"rendu reportlab {t['rendu']:.2f} s"
+            )
+            rendus = [g for g in self.groupes if not (g.get('saute') or g.get('repris'))]
+            lents = sorted(rendus, key=lambda g: g.get('duree', 0), reverse=True)[:NB_GROUPES_LENTS]
+            lignes.append("   Plus lents: " + ", ".join(
+                f"{g['groupe']} ({g.get('duree', 0):.2f} s, {g.get('lignes', 0)} lignes)" for g in lents
+            ))
+        return lignes
+
+    def rapport(self, **contexte):
+        """Rapport complet (contexte de la génération, étapes, totaux, groupes)"""
+        return {
+            'debut': self.debut.isoformat(timespec='seconds'),
+            'fin': datetime.now().isoformat(timespec='seconds'),
+            **contexte,
+            'etapes': {etape: round(duree, 4) for etape, duree in self.etapes.items()},
+            'totaux': {cle: round(v, 4) if isinstance(v, float) else v for cle, v in self.totaux().items()},
+            'groupes': [
+                {cle: round(v, 4) if isinstance(v, float) else v for cle, v in groupe.items()}
+                for groupe in self.groupes
+            ],
+        }
+
+    def enregistrer(self, chemin, **contexte):
+        """Écrit le rapport JSON, renvoie son chemin"""
+        with open(chemin, 'w', encoding='utf-8') as f:
+            json.dump(self.rapport(**contexte), f, ensure_ascii=False, indent=2, default=str)
+        return chemin
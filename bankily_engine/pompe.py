@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Relais entre les threads de génération et l'interface Tk
+Les threads déposent messages, progression et actions dans une file ; le
+thread Tk les applique par lots sur minuterie, avec un seul rafraîchissement
+par lot. N'importe pas Tkinter : seul root.after() est utilisé.
+"""
+
+import time
+import queue
+import threading
+from datetime import datetime
+
+# Intervalle entre deux lots (au plus un rafraîchissement de l'écran par intervalle)
+INTERVALLE_POMPE_MS = 100
+
+# Événements traités au plus par lot (le reste attend le lot suivant)
+MAX_EVENEMENTS_PAR_LOT = 2000
+
+
+class PompeInterface:
+    """File d'événements de l'interface, vidée par le thread Tk"""
+
+    def __init__(self, root, zone_journal, barre_progression, intervalle_ms=INTERVALLE_POMPE_MS):
+        self.root = root
+        self.zone_journal = zone_journal
+        self.barre_progression = barre_progression
+        self.intervalle_ms = intervalle_ms
+        self._file = queue.SimpleQueue()
+        self._dernier_lot = 0.0
+        # Vidange en cours : un message émis par une action du lot attend sa fin (ordre conservé)
+        self._vidange = False
+
+    def demarrer(self):
+        """Lance la vidange périodique (à appeler depuis le thread Tk)"""
+        self.root.after(self.intervalle_ms, self._cycle)
+
+    def journal(self, message):
+        """Ajoute un message horodaté au journal (depuis n'importe quel thread)"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._file.put(('journal', f"[{timestamp}] {message}\n"))
+        self._vider_si_thread_tk()
+
+    def progression(self, fraction):
+        """Positionne la barre de progression, fraction de 0 à 1 (depuis n'importe quel thread)"""
+        self._file.put(('progression', fraction))
+        self._vider_si_thread_tk()
+
+    def appeler(self, fonction, *args, **kwargs):
+        """Exécute fonction(*args, **kwargs) sur le thread Tk, dans l'ordre des autres événements"""
+        self._file.put(('appel', (fonction, args, kwargs)))
+
+    def _vider_si_thread_tk(self):
+        # Traitement long sur le thread Tk (la boucle principale ne tourne pas) :
+        # afficher quand même, sans dépasser la fréquence de rafraîchissement
+        if threading.current_thread() is threading.main_thread():
+            if (time.monotonic() - self._dernier_lot) * 1000 >= self.intervalle_ms:
+                self.vider()
+
+    def _cycle(self):
+        try:
+            self.vider()
+        finally:
+            self.root.after(self.intervalle_ms, self._cycle)
+
+    def vider(self):
+        """Applique les événements en attente par lot (thread Tk uniquement)"""
+        if self._vidange:
+            return
+        self._vidange = True
+        try:
+            self._vider_lot()
+        finally:
+            self._vidange = False
+
+    def _vider_lot(self):
+        self._dernier_lot = time.monotonic()
+        lignes = []
+        progression = None
+
+        def appliquer():
+            nonlocal progression
+            if lignes:
+                self.zone_journal.insert('end', ''.join(lignes))
+                self.zone_journal.see('end')
+                lignes.clear()
+            if progression is not None:
+                self.barre_progression['value'] = progression * 100
+                progression = None
+
+        traites = 0
+        while traites < MAX_EVENEMENTS_PAR_LOT:
+            try:
+                genre, valeur = self._file.get_nowait()
+            except queue.Empty:
+                break
+            traites += 1
+            if genre == 'journal':
+                lignes.append(valeur)
+            elif genre == 'progression':
+                # Seule la dernière valeur compte
+                progression = valeur
+            else:
+                appliquer()
+                fonction, args, kwargs = valeur
+                fonction(*args, **kwargs)
+
+        appliquer()
+        if traites:
+            self.root.update_idletasks()
@@ -0,0 +1,896 @@
+# -*- coding: utf-8 -*-
+"""
+Chaîne commune des rapports BANKILY : regroupement, rendu PDF (séquentiel ou
+pool de processus) et archive ZIP. Chaque type de rapport (centres,
+commerçants, agents) n'est qu'une sous-classe de GenerateurPDF qui décrit
+ses colonnes, son titre et le contenu propre de son relevé.
+"""
+
+import io
+import os
+import re
+import errno
+import shutil
+import struct
+import time
+import zlib
+import zipfile
+from functools import lru_cache
+from collections.abc import Mapping
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.lib.colors import Color
+from reportlab.lib import colors
+
+from bankily_engine.cache_pdf import CachePDF, nettoyer_cache_pdf
+from bankily_engine.logos import Logo, preparer_logos
+from bankily_engine.rendu_canvas import (
+    MARGE_BAS, MARGE_DROITE, MARGE_GAUCHE, MARGE_HAUT, RenduCanvas, hauteur_ligne, lignes_texte_max
+)
+
+# Moteurs de rendu PDF disponibles (GenerateurPDF.MOTEUR) : platypus, platypus
+# avec tableau découpé en morceaux d'une page, canvas direct
+MOTEURS = ('platypus', 'pages', 'canvas')
+
+# Zone utile d'une page SimpleDocTemplate (marges et padding de 6 du cadre)
+LARGEUR_CADRE = A4[0] - MARGE_GAUCHE - MARGE_DROITE - 12
+HAUTEUR_CADRE = A4[1] - MARGE_HAUT - MARGE_BAS - 12
+
+
+def formater_nombre(valeur, decimales=1):
+    """Nombre avec espace comme séparateur des milliers (1 234 567.0)"""
+    return f"{valeur:,.{decimales}f}".replace(',', ' ')
+
+
+def formater_nombres(serie, decimales=1, vide=None):
+    """
+    formater_nombre appliqué à toute une colonne, en une seule passe.
+    vide : texte des valeurs manquantes (None : formatées telles quelles)
+    """
+    fmt = f"{{:,.{decimales}f}}".format
+    valeurs = serie.tolist()
+    if vide is None:
+        return [fmt(v).replace(',', ' ') for v in valeurs]
+    presents = serie.notna().tolist()
+    return [fmt(v).replace(',', ' ') if ok else vide for v, ok in zip(valeurs, presents)]
+
+
+# Position de chaque directive strftime dans "AAAA-MM-JJTHH:MM:SS" (ISO 8601)
+POSITIONS_ISO = {'Y': (0, 4), 'm': (5, 7), 'd': (8, 10), 'H': (11, 13), 'M': (14, 16), 'S': (17, 19)}
+
+
+def formater_dates(serie, format_date, vide=""):
+    """
+    Colonne de dates en texte, dates manquantes remplacées par vide.
+    Les formats limités à %d %m %Y %H %M %S sont produits sans strftime : les
+    caractères de la forme ISO (numpy) sont réordonnés en un seul tableau.
+    """
+    morceaux = re.findall(r'%(.)|([^%]+)', format_date)
+    if not pd.api.types.is_datetime64_dtype(serie) or any(
+            directive and directive not in POSITIONS_ISO for directive, _ in morceaux):
+        return serie.dt.strftime(format_date).where(serie.notna(), vide).tolist()
+    if serie.empty:
+        return []
+
+    iso = np.datetime_as_string(serie.to_numpy(dtype='datetime64[s]'), unit='s').astype('U19')
+    caracteres = iso.view('U1').reshape(len(iso), 19)
+    colonnes = []
+    for directive, texte in morceaux:
+        if directive:
+            debut, fin = POSITIONS_ISO[directive]
+            colonnes.extend(caracteres[:, i] for i in range(debut, fin))
+        else:
+            colonnes.extend(np.full(len(iso), c) for c in texte)
+    sortie = np.ascontiguousarray(np.stack(colonnes, axis=1).astype('U1'))
+    textes = sortie.view(f'U{len(colonnes)}').ravel().tolist()
+
+    presents = serie.notna().tolist()
+    return [t if ok else vide for t, ok in zip(textes, presents)]
+
+
+def colonne_texte(df, colonne, vide=""):
+    """Colonne en texte ; valeurs manquantes (ou colonne absente) remplacées par vide"""
+    if colonne not in df.columns:
+        return [vide] * len(df)
+    serie = df[colonne]
+    return serie.astype(str).where(serie.notna(), vide).tolist()
+
+
+def style_tableau(alignements, padding_horizontal=3, wordwrap=((0, 0), (-1, -1))):
+    """
+    Style des tableaux de transactions : en-tête bleu clair, corps en petit
+    Helvetica, grille noire. alignements : alignement de chaque colonne du corps.
+    """
+    commandes = [
+        # En-tête
+        ('BACKGROUND', (0, 0), (-1, 0), Color(0.7, 0.8, 1.0)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+
+        # Corps
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 7),
+    ]
+    commandes += [
+        ('ALIGN', (i, 1), (i, -1), alignement)
+        for i, alignement in enumerate(alignements)
+    ]
+    commandes += [
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+
+        ('LEFTPADDING', (0, 0), (-1, -1), padding_horizontal),
+        ('RIGHTPADDING', (0, 0), (-1, -1), padding_horizontal),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+
+        # Gestion du texte long
+        ('WORDWRAP', wordwrap[0], wordwrap[1], True),
+    ]
+    return TableStyle(commandes)
+
+
+# En-tête des relevés de crédit (centres et commerçants), colonne 3 = groupe
+ENTETE_RELEVE_CREDIT = ["ID", "Date crédit compte", "Client", None, "Montant de crédit"]
+
+
+def lignes_releve_credit(df, nom, libelle_groupe):
+    """Lignes du tableau des crédits, en-tête compris (df déjà trié, plus récents en premier)"""
+    entete = list(ENTETE_RELEVE_CREDIT)
+    entete[3] = libelle_groupe
+
+    # Chaque colonne affichée est formatée en une passe, puis assemblée par zip
+    if pd.api.types.is_numeric_dtype(df['ID']):
+        # Identifiants numériques : entiers sans notation scientifique
+        ids = [str(int(v)) if v == v else str(v) for v in df['ID'].tolist()]
+    else:
+        # Conserver l'ID complet comme string (avec les zéros en début)
+        ids = df['ID'].astype(str).str.strip().tolist()
+    dates = formater_dates(df['DATEP'], '%d/%m/%Y %H:%M')
+    clients = df['CLIENT'].astype(str).tolist() if 'CLIENT' in df.columns else [""] * len(df)
+    montants = formater_nombres(df['MONTANT'])
+
+    data = [entete]
+    data.extend(
+        [id_transaction, date, client, nom, montant]
+        for id_transaction, date, client, montant in zip(ids, dates, clients, montants)
+    )
+    return data
+
+
+# Lignes d'information (étiquette : valeur) sous le titre
+LARGEUR_ETIQUETTE = 4*cm
+LARGEUR_VALEUR = 13*cm
+
+STYLE_INFO = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
+
+# Logos de l'en-tête : BPM à gauche, BANKILY à droite
+STYLE_LOGOS = TableStyle([
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+    ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+# Total sous le tableau
+STYLE_TOTAL = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
+])
+
+
+@lru_cache(maxsize=None)
+def feuille_styles():
+    """Styles de paragraphe des relevés, construits une fois par processus"""
+    styles = getSampleStyleSheet()
+
+    # Titre noir
+    styles.add(ParagraphStyle(
+        name='TitreRapport',
+        parent=styles['Title'],
+        fontSize=16,
+        spaceAfter=15,
+        alignment=1,
+        textColor=colors.black
+    ))
+    return styles
+
+
+class GenerateurPDF:
+    """
+    Rendu PDF d'un relevé par groupe, sans dépendance à Tkinter (utilisable en
+    sous-processus). Les sous-classes renseignent les attributs ci-dessous et
+    implémentent charger() et add_contenu().
+    """
+
+    # Type de rapport : sous-commande de la ligne de commande, manifestes de reprise, mesures
+    TYPE_RAPPORT = None
+    # Colonne de regroupement des transactions (un PDF par valeur)
+    COLONNE_GROUPE = None
+    # Colonne totalisée dans la liste des groupes
+    COLONNE_TOTAL = 'MONTANT'
+    # Ordre des transactions dans chaque relevé
+    COLONNE_DATE = None
+    DATES_DECROISSANTES = False
+    # Titre en tête du relevé
+    TITRE = ""
+    # Préfixe de l'archive ZIP et des fichiers PDF
+    PREFIXE_ZIP = "Rapports"
+    PREFIXE_PDF = "Rapport"
+    # Libellé du groupe dans le journal ("Agent 00123")
+    LIBELLE = ""
+    # Tableau des transactions : alignement du corps, marge horizontale, cellules repliées
+    ALIGNEMENTS = ()
+    PADDING_TABLEAU = 3
+    WORDWRAP_TABLEAU = ((0, 0), (-1, -1))
+    # Moteur de rendu : 'platypus' (mise en page reportlab), 'pages' (platypus,
+    # tableau en morceaux d'une page à hauteurs fixes) ou 'canvas' (RenduCanvas)
+    MOTEUR = 'platypus'
+
+    def __init__(self, logo_bpm=None, logo_bankily=None, moteur=None):
+        self.logo_bpm = logo_bpm
+        self.logo_bankily = logo_bankily
+        # Logos décodés et réduits une seule fois pour tous les PDF du générateur
+        self.logos = preparer_logos(logo_bpm, logo_bankily)
+        self.moteur = moteur or self.MOTEUR
+        self.messages = []
+        # Vrai si le dernier PDF rendu affiche la date du jour (il n'est pas mis en cache)
+        self.date_du_jour = False
+        # Mesures du dernier PDF rendu (durées, pages, octets) pour bankily_engine.mesures
+        self.mesure = {}
+        self.setup_pdf_styles()
+
+    @staticmethod
+    def charger(chemin, journal=None, progression=None):
+        """Charge le fichier Excel du rapport en DataFrame"""
+        raise NotImplementedError
+
+    @classmethod
+    def analyser(cls, df):
+        """Résumé et GroupesTransactions du fichier chargé (voir analyser_groupes)"""
+        return analyser_groupes(df, cls.COLONNE_GROUPE, cls.COLONNE_TOTAL,
+                                cls.COLONNE_DATE, cls.DATES_DECROISSANTES)
+
+    def log_message(self, message):
+        """Mémorise le message (renvoyé au journal de l'interface)"""
+        self.messages.append(message)
+
+    def setup_pdf_styles(self):
+        """Styles PDF partagés par tous les groupes (feuille_styles, style_releve)"""
+        self.styles = feuille_styles()
+        self.style_transactions = self.style_releve()
+
+    @classmethod
+    def style_releve(cls):
+        """Style du tableau des transactions, construit une fois par type de rapport"""
+        style = cls.__dict__.get('_style_releve')
+        if style is None:
+            style = style_tableau(
+                cls.ALIGNEMENTS,
+                padding_horizontal=cls.PADDING_TABLEAU,
+                wordwrap=cls.WORDWRAP_TABLEAU
+            )
+            cls._style_releve = style
+        return style
+
+    @classmethod
+    def nom_affiche(cls, nom):
+        """Nom du groupe dans le journal"""
+        return f"{cls.LIBELLE} {nom}" if cls.LIBELLE else str(nom)
+
+    @classmethod
+    def resume_groupe(cls, data):
+        """Résumé d'un PDF généré pour le journal"""
+        return f"{len(data)} transactions"
+
+    def nom_pdf(self, nom):
+        """Nom du fichier PDF d'un groupe"""
+        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{self.PREFIXE_PDF}_{str(nom).replace(' ', '_')}_{date_str}.pdf"
+
+    def create_pdf(self, nom, data, output_dir):
+        """Crée le PDF d'un groupe, renvoie son chemin (None en cas d'erreur)"""
+        pdf_path = os.path.join(output_dir, self.nom_pdf(nom))
+        if not self.rendre_pdf(pdf_path, nom, data):
+            return None
+        self.mesure['octets'] = os.path.getsize(pdf_path)
+        return pdf_path
+
+    def pdf_en_memoire(self, nom, data):
+        """Rend le PDF d'un groupe en mémoire, renvoie (nom du fichier, contenu) (None en cas d'erreur)"""
+        tampon = io.BytesIO()
+        if not self.rendre_pdf(tampon, nom, data):
+            return None
+        contenu = tampon.getvalue()
+        self.mesure['octets'] = len(contenu)
+        return self.nom_pdf(nom), contenu
+
+    def copier_pdf(self, nom, contenu, output_dir):
+        """PDF déjà rendu (cache) : écrit dans output_dir comme create_pdf, ou (nom du fichier, contenu) si None"""
+        self.mesure['octets'] = len(contenu)
+        if output_dir is None:
+            return self.nom_pdf(nom), contenu
+        pdf_path = os.path.join(output_dir, self.nom_pdf(nom))
+        with open(pdf_path, 'wb') as f:
+            f.write(contenu)
+        return pdf_path
+
+    def rendre_pdf(self, sortie, nom, data):
+        """Rend le PDF d'un groupe dans sortie (chemin ou fichier ouvert), renvoie False en cas d'erreur"""
+        try:
+            debut = time.perf_counter()
+            if self.moteur == 'canvas':
+                self.rendre_canvas(sortie, nom, data, debut)
+                return True
+
+            doc = SimpleDocTemplate(
+                sortie,
+                pagesize=A4,
+                rightMargin=MARGE_DROITE,
+                leftMargin=MARGE_GAUCHE,
+                topMargin=MARGE_HAUT,
+                bottomMargin=MARGE_BAS
+            )
+
+            story = []
+
+            # En-tête
+            self.add_header(story)
+
+            # Informations, tableau et totaux propres au type de rapport
+            self.add_contenu(story, nom, data)
+
+            construit = time.perf_counter()
+            doc.build(story)
+            self.mesure.update(construction=construit - debut, rendu=time.perf_counter() - construit,
+                               pages=doc.page)
+            return True
+
+        except Exception as e:
+            self.log_message(f"❌ Erreur PDF {self.nom_affiche(nom)}: {e}")
+            return False
+
+    def rendre_canvas(self, pdf_path, nom, data, debut=None):
+        """Même relevé dessiné directement sur canvas (relevés très volumineux)"""
+        debut = debut or time.perf_counter()
+        infos = self.lignes_info(nom, data)
+        lignes, largeurs = self.tableau(nom, data)
+        total = self.texte_total(data)
+        construit = time.perf_counter()
+
+        rendu = RenduCanvas(pdf_path, self.logos, titre=self.TITRE)
+        rendu.dessiner_entete()
+        rendu.dessiner_infos(infos)
+        rendu.dessiner_tableau(lignes, largeurs, self.ALIGNEMENTS, self.PADDING_TABLEAU)
+        if total:
+            rendu.dessiner_total(total)
+        rendu.enregistrer()
+        self.mesure.update(construction=construit - debut, rendu=time.perf_counter() - construit,
+                           pages=rendu.pages)
+
+    def lignes_info(self, nom, data):
+        """Lignes étiquette : valeur sous le titre"""
+        raise NotImplementedError
+
+    def tableau(self, nom, data):
+        """Tableau des transactions : (lignes avec l'en-tête en premier, largeurs des colonnes)"""
+        raise NotImplementedError
+
+    def texte_total(self, data):
+        """Total affiché sous le tableau (None : pas de total)"""
+        return f"Total : {formater_nombre(data['MONTANT'].sum())} MRU"
+
+    def add_header(self, story):
+        """En-tête style BANKILY"""
+        # Logos (préparés une fois, voir preparer_logos)
+        if self.logos:
+            logo_bpm, logo_bankily = self.logos
+            data = [[Logo(logo_bpm), "", Logo(logo_bankily)]]
+            table = Table(data, colWidths=[4*cm, 9*cm, 4*cm])
+            table.setStyle(STYLE_LOGOS)
+            story.append(table)
+            story.append(Spacer(1, 20))
+
+        # Titre
+        story.append(Paragraph(
+            f"<b>{self.TITRE}</b>",
+            self.styles['TitreRapport']
+        ))
+        story.append(Spacer(1, 20))
+
+    def add_contenu(self, story, nom, data):
+        """Corps du relevé (informations, tableau, totaux)"""
+        raise NotImplementedError
+
+    def add_lignes_info(self, story, lignes):
+        """Lignes étiquette : valeur alignées sur une colonne d'étiquettes fixe"""
+        for i, ligne in enumerate(lignes):
+            if i:
+                story.append(Spacer(1, 2))
+            table = Table([ligne], colWidths=[LARGEUR_ETIQUETTE, LARGEUR_VALEUR])
+            table.setStyle(STYLE_INFO)
+            story.append(table)
+
+    def add_tableau(self, story, nom, data):
+        """Tableau des transactions (voir tableau())"""
+        lignes, largeurs = self.tableau(nom, data)
+        style = self.style_transactions
+        if self.moteur == 'pages':
+            story.extend(self.morceaux_tableau(story, lignes, largeurs, style))
+            return
+        table = Table(lignes, colWidths=largeurs)
+        table.setStyle(style)
+        story.append(table)
+
+    def morceaux_tableau(self, story, lignes, largeurs, style):
+        """
+        Tableau découpé en morceaux remplissant chacun une page, lignes de hauteur
+        fixe et en-tête répété : platypus n'a plus à mesurer les cellules ni à
+        redécouper un tableau de plusieurs milliers de lignes à chaque page.
+        """
+        entete, corps = lignes[0], lignes[1:]
+        hauteur_entete = hauteur_ligne(1)
+        hauteur_corps = hauteur_ligne(lignes_texte_max(corps))
+        par_page = max(1, int((HAUTEUR_CADRE - hauteur_entete) // hauteur_corps))
+
+        # Place restante sous l'en-tête et les informations de la première page
+        occupe = sum(
+            f.wrap(LARGEUR_CADRE, HAUTEUR_CADRE)[1] + f.getSpaceBefore() + f.getSpaceAfter()
+            for f in story
+        )
+        premier = int((HAUTEUR_CADRE - occupe - hauteur_entete) // hauteur_corps)
+        if premier < 1:
+            premier = par_page
+
+        morceaux = []
+        debut, taille = 0, premier
+        while True:
+            bloc = corps[debut:debut + taille]
+            table = Table([entete] + bloc, colWidths=largeurs,
+                          rowHeights=[hauteur_entete] + [hauteur_corps] * len(bloc),
+                          repeatRows=1)
+            table.setStyle(style)
+            morceaux.append(table)
+            debut += taille
+            if debut >= len(corps):
+                return morceaux
+            taille = par_page
+
+    def add_summary(self, story, df):
+        """Résumé"""
+        story.append(Spacer(1, 30))
+
+        data = [[self.texte_total(df)]]
+
+        table = Table(data, colWidths=[17*cm])
+        table.setStyle(STYLE_TOTAL)
+
+        story.append(table)
+
+
+class GroupesTransactions(Mapping):
+    """
+    Groupes d'un DataFrame trié par groupe : chaque groupe est la plage de
+    lignes [début, fin) du DataFrame de base, extraite sans copie à l'accès.
+    """
+
+    def __init__(self, df, bornes):
+        self.df = df
+        self.bornes = bornes
+
+    def __getitem__(self, nom):
+        debut, fin = self.bornes[nom]
+        return self.df.iloc[debut:fin]
+
+    def __iter__(self):
+        return iter(self.bornes)
+
+    def __len__(self):
+        return len(self.bornes)
+
+
+def analyser_groupes(df, colonne, colonne_total=None, colonne_date=None, dates_decroissantes=False):
+    """
+    Trie une seule fois les transactions par (groupe, date) puis résume chaque
+    groupe en un seul groupby. Renvoie le résumé (colonnes nb et total, groupes
+    triés) et les GroupesTransactions correspondants. Les lignes sans groupe
+    sont ignorées, les dates manquantes placées en fin de groupe.
+    """
+    base = df[df[colonne].notna()]
+    cles = [colonne] + ([colonne_date] if colonne_date in df.columns else [])
+    sens = [True, not dates_decroissantes][:len(cles)]
+    base = base.sort_values(cles, ascending=sens, na_position='last', kind='stable')
+    base = base.reset_index(drop=True)
+
+    # Groupes contigus dans la base : l'ordre d'apparition est l'ordre trié
+    groupes = base.groupby(colonne, sort=False)
+    if colonne_total and colonne_total in base.columns:
+        resume = groupes[colonne_total].agg(['size', 'sum'])
+    else:
+        resume = groupes.size().to_frame('size')
+        resume['sum'] = 0
+    resume.columns = ['nb', 'total']
+
+    fins = resume['nb'].cumsum()
+    bornes = {
+        nom: (fin - nb, fin)
+        for nom, nb, fin in zip(resume.index, resume['nb'].tolist(), fins.tolist())
+    }
+    return resume, GroupesTransactions(base, bornes)
+
+
+# Générateur propre à chaque processus du pool (créé une seule fois par processus)
+_generateur_worker = None
+# Cache des PDF rendus du processus (None : désactivé)
+_cache_worker = None
+
+# Délai maximal de prise en compte d'une demande d'arrêt pendant le rendu parallèle
+INTERVALLE_ANNULATION_S = 0.2
+# Groupes sautés cités dans le journal après un arrêt (tous figurent dans les mesures)
+MAX_GROUPES_SAUTES_AFFICHES = 50
+
+
+def initialiser_worker(classe, logo_bpm, logo_bankily, moteur=None, cache=None):
+    """Initialise le générateur PDF (et le cache des PDF) du processus courant (pool ou exécution directe)"""
+    global _generateur_worker, _cache_worker
+    _generateur_worker = classe(logo_bpm, logo_bankily, moteur)
+    _cache_worker = cache
+
+
+def generer_pdf_worker(nom, data, output_dir):
+    """
+    Rend un PDF avec le générateur du processus, dans output_dir ou en mémoire
+    si output_dir est None, ou le reprend du cache si le groupe n'a pas changé.
+    Renvoie (chemin ou (nom du fichier, contenu), messages du journal, mesures
+    du groupe : lignes, durées, pages, octets, cache)
+    """
+    debut = time.perf_counter()
+    _generateur_worker.messages = []
+    _generateur_worker.date_du_jour = False
+    _generateur_worker.mesure = {'lignes': len(data)}
+    cache = _cache_worker
+    empreinte = cache.empreinte(nom, data) if cache else None
+    entree = cache.lire(empreinte) if cache else None
+    if entree is not None:
+        contenu, messages = entree
+        pdf = _generateur_worker.copier_pdf(nom, contenu, output_dir)
+        # Messages émis au rendu d'origine (période, dates illisibles...)
+        _generateur_worker.messages.extend(messages)
+        _generateur_worker.mesure['cache'] = True
+    else:
+        if output_dir is None:
+            pdf = _generateur_worker.pdf_en_memoire(nom, data)
+        else:
+            pdf = _generateur_worker.create_pdf(nom, data, output_dir)
+        # Un relevé daté du jour faute de dates valides ne doit pas resservir les jours suivants
+        if pdf and cache and not _generateur_worker.date_du_jour:
+            cache.ecrire(empreinte, pdf[1] if output_dir is None else pdf, _generateur_worker.messages)
+    _generateur_worker.mesure['duree'] = time.perf_counter() - debut
+    return pdf, _generateur_worker.messages, _generateur_worker.mesure
+
+
+def generer_rapports(classe, groupes, output_dir, logos=(None, None), nb_processus=1,
+                     journal=None, progression=None, moteur=None, mesures=None, annulation=None,
+                     reprise=None, cache_pdf=None):
+    """
+    Rend un PDF par groupe dans output_dir (dossier, ou ArchiveZip ouverte qui
+    reçoit chaque PDF depuis la mémoire dès qu'il est rendu, dans l'ordre où
+    les rendus se terminent), dans le processus
+    courant ou dans un pool de nb_processus processus. journal reçoit les
+    messages, progression la fraction des groupes traités (0 à 1), moteur le
+    moteur de rendu (défaut : classe.MOTEUR), mesures (bankily_engine.mesures.Mesures)
+    les mesures de chaque groupe et le temps d'écriture de l'archive.
+    annulation (bankily_engine.annulation.JetonAnnulation) arrête la génération :
+    les groupes en cours de rendu se terminent, les suivants sont sautés et
+    listés au journal ; l'archive ne contient que les PDF terminés.
+    reprise (bankily_engine.reprise.Reprise, sortie ouverte par reprise.ouvrir)
+    note chaque PDF produit ; les groupes qu'elle a déjà produits ne sont pas
+    rendus de nouveau. cache_pdf : dossier du cache des PDF rendus
+    (bankily_engine.cache_pdf) ; un groupe inchangé depuis un rendu précédent
+    avec les mêmes réglages y est repris au lieu d'être rendu (None : sans cache).
+    Renvoie (PDF dans l'ordre des groupes : chemins, ou noms dans l'archive ; nombre d'échecs).
+    """
+    journal = journal or (lambda message: None)
+    total = len(groupes)
+    pdf_par_groupe = {}
+    echecs = 0
+    traites = 0
+    sautes = set()
+
+    archive = output_dir if isinstance(output_dir, ArchiveZip) else None
+    dossier = None if archive else output_dir
+
+    def resultat(nom, pdf, messages, mesure, saute=False, repris=False):
+        nonlocal echecs, traites
+        traites += 1
+        for message in messages:
+            journal(message)
+        if mesures is not None:
+            etat = {'saute': True} if saute else {'repris': True} if repris else {}
+            mesures.ajouter_groupe(nom, {**mesure, 'ok': bool(pdf), **etat})
+        if archive and pdf:
+            # Écrit dès sa réception, sans attendre les groupes précédents :
+            # aucun PDF ne s'accumule en mémoire derrière un gros groupe
+            if not repris:
+                debut = time.perf_counter()
+                archive.ajouter(*pdf)
+                if mesures is not None:
+                    mesures.ajouter_duree('ecriture_zip', time.perf_counter() - debut)
+            pdf = pdf[0]
+        if pdf and reprise is not None and not repris:
+            reprise.enregistrer(nom, pdf)
+        if pdf:
+            pdf_par_groupe[nom] = pdf
+            if not repris:
+                origine = " (cache)" if mesure.get('cache') else ""
+                journal(f"✅ [{traites}/{total}] PDF {classe.nom_affiche(nom)}: "
+                        f"{classe.resume_groupe(groupes[nom])}{origine}")
+        elif saute:
+            sautes.add(nom)
+        else:
+            echecs += 1
+        if progression:
+            progression(traites / total)
+
+    def sauter(nom):
+        resultat(nom, None, [], {'lignes': len(groupes[nom])}, saute=True)
+
+    def reprendre(nom):
+        """Groupe déjà produit par la génération interrompue (PDF gardé tel quel)"""
+        pdf = reprise.pdf(nom)
+        resultat(nom, (pdf, None) if archive else pdf, [], {'lignes': len(groupes[nom])}, repris=True)
+
+    def arret_demande():
+        return annulation is not None and annulation.annule
+
+    def echec(nom, e):
+        return None, [f"❌ Erreur {classe.nom_affiche(nom)}: {e}"], {'lignes': len(groupes[nom])}
+
+    cache = None
+    if cache_pdf:
+        try:
+            cache = CachePDF.pour_generateur(classe, logos, moteur, cache_pdf)
+        except OSError as e:
+            # Dossier du cache impossible à créer (lecture seule...) : génération sans cache
+            journal(f"⚠️ Cache PDF indisponible: {e}")
+
+    a_rendre = [nom for nom in groupes if reprise is None or not reprise.termine(nom)]
+    if len(a_rendre) < total:
+        journal(f"♻️ Reprise: {total - len(a_rendre)} groupe(s) déjà produit(s), {len(a_rendre)} restant(s)")
+        for nom in groupes:
+            if reprise.termine(nom):
+                reprendre(nom)
+
+    if nb_processus > 1 and len(a_rendre) > 1:
+        journal(f"⚙️ Rendu parallèle sur {nb_processus} processus")
+        with ProcessPoolExecutor(
+            max_workers=nb_processus,
+            initializer=initialiser_worker,
+            initargs=(classe,) + tuple(logos) + (moteur, cache)
+        ) as executor:
+            futures = {
+                executor.submit(generer_pdf_worker, nom, groupes[nom], dossier): nom
+                for nom in a_rendre
+            }
+            en_cours = set(futures)
+            arrete = False
+            while en_cours:
+                finis, en_cours = wait(en_cours, timeout=INTERVALLE_ANNULATION_S, return_when=FIRST_COMPLETED)
+                if not arrete and arret_demande():
+                    # Groupes pas encore confiés à un processus : retirés de la file
+                    arrete = True
+                    for future in en_cours:
+                        future.cancel()
+                for future in finis:
+                    nom = futures[future]
+                    if future.cancelled():
+                        sauter(nom)
+                        continue
+                    try:
+                        pdf, messages, mesure = future.result()
+                    except Exception as e:
+                        pdf, messages, mesure = echec(nom, e)
+                    resultat(nom, pdf, messages, mesure)
+    else:
+        initialiser_worker(classe, *logos, moteur, cache)
+        for nom in a_rendre:
+            if arret_demande():
+                sauter(nom)
+                continue
+            try:
+                pdf, messages, mesure = generer_pdf_worker(nom, groupes[nom], dossier)
+            except Exception as e:
+                pdf, messages, mesure = echec(nom, e)
+            resultat(nom, pdf, messages, mesure)
+
+    if sautes:
+        noms = [classe.nom_affiche(nom) for nom in groupes if nom in sautes]
+        journal(f"⏹️ Génération arrêtée: {len(noms)} groupe(s) non traité(s) sur {total}")
+        suite = f", … (+{len(noms) - MAX_GROUPES_SAUTES_AFFICHES})" if len(noms) > MAX_GROUPES_SAUTES_AFFICHES else ""
+        journal("   Non traités: " + ", ".join(noms[:MAX_GROUPES_SAUTES_AFFICHES]) + suite)
+
+    if cache:
+        nettoyer_cache_pdf(cache.dossier)
+
+    # Liste dans l'ordre des groupes (l'archive suit l'ordre de fin des rendus)
+    pdf_files = [pdf_par_groupe[nom] for nom in groupes if nom in pdf_par_groupe]
+    return pdf_files, echecs
+
+
+def nom_zip(classe):
+    """Nom horodaté de l'archive d'un type de rapport"""
+    date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{classe.PREFIXE_ZIP}_{date_str}.zip"
+
+
+# Compression des PDF dans l'archive : (méthode ZIP, niveau deflate), 'auto' choisit par fichier
+COMPRESSIONS_ZIP = {
+    'aucune': (zipfile.ZIP_STORED, None),
+    'rapide': (zipfile.ZIP_DEFLATED, 1),
+    'max': (zipfile.ZIP_DEFLATED, 9),
+    'auto': None,
+}
+COMPRESSION_ZIP_DEFAUT = 'auto'
+
+# Mode auto : gain minimal (fraction de la taille) pour compresser un fichier,
+# estimé sur ECHANTILLONS_ZIP extraits de TAILLE_ECHANTILLON_ZIP octets
+GAIN_MIN_COMPRESSION = 0.05
+ECHANTILLONS_ZIP = 3
+TAILLE_ECHANTILLON_ZIP = 8192
+
+
+def gain_compression(contenu):
+    """Gain estimé d'un deflate rapide (0 à 1), mesuré sur quelques extraits du fichier"""
+    taille = len(contenu)
+    if taille <= ECHANTILLONS_ZIP * TAILLE_ECHANTILLON_ZIP:
+        echantillon = contenu
+    else:
+        pas = (taille - TAILLE_ECHANTILLON_ZIP) // (ECHANTILLONS_ZIP - 1)
+        echantillon = b''.join(
+            contenu[i * pas:i * pas + TAILLE_ECHANTILLON_ZIP] for i in range(ECHANTILLONS_ZIP)
+        )
+    if not echantillon:
+        return 0.0
+    return 1 - len(zlib.compress(echantillon, 1)) / len(echantillon)
+
+
+def entrees_locales(fichier, fin):
+    """
+    Entrées (ZipInfo) d'une archive sans répertoire central, relues depuis
+    les en-têtes locaux de ses fin premiers octets. ValueError si ces octets
+    ne sont pas une suite d'entrées complètes.
+    """
+    entrees = []
+    position = 0
+    while position < fin:
+        fichier.seek(position)
+        entete = fichier.read(zipfile.sizeFileHeader)
+        if len(entete) < zipfile.sizeFileHeader:
+            raise ValueError("Archive tronquée")
+        (signature, version, _, drapeaux, methode, heure, date, crc,
+         taille_compressee, taille, longueur_nom, longueur_extra) = struct.unpack(zipfile.structFileHeader, entete)
+        # Données descriptor (bit 3) ou tailles ZIP64 : non produites par ArchiveZip
+        if signature != zipfile.stringFileHeader or drapeaux & 0x08 or 0xFFFFFFFF in (taille_compressee, taille):
+            raise ValueError(f"Entrée illisible à l'octet {position}")
+        nom = fichier.read(longueur_nom).decode('utf-8' if drapeaux & 0x800 else 'cp437')
+        info = zipfile.ZipInfo(nom, (1980 + (date >> 9), (date >> 5) & 0xF, date & 0x1F,
+                                     heure >> 11, (heure >> 5) & 0x3F, (heure & 0x1F) * 2))
+        info.flag_bits = drapeaux
+        info.extract_version = version
+        info.compress_type = methode
+        info.CRC = crc
+        info.compress_size = taille_compressee
+        info.file_size = taille
+        info.header_offset = position
+        info.external_attr = 0o600 << 16
+        entrees.append(info)
+        position += zipfile.sizeFileHeader + longueur_nom + longueur_extra + taille_compressee
+    if position != fin:
+        raise ValueError("Archive tronquée")
+    return entrees
+
+
+class ArchiveZip:
+    """
+    Archive ZIP remplie au fil de la génération : chaque PDF y est compressé
+    depuis la mémoire dès qu'il est rendu, sans fichier temporaire ni passe de
+    compression finale. Fermée (avec) même si la génération s'interrompt sur
+    une erreur : l'archive reste lisible avec les PDF déjà rendus.
+    compression : clé de COMPRESSIONS_ZIP ('auto' : deflate rapide seulement
+    si un échantillon du fichier y gagne au moins GAIN_MIN_COMPRESSION).
+    fin : reprise d'une archive interrompue, dont les fin premiers octets
+    (voir position) sont conservés ; les PDF suivants sont ajoutés après.
+    """
+
+    def __init__(self, chemin, compression=COMPRESSION_ZIP_DEFAUT, fin=None):
+        if compression not in COMPRESSIONS_ZIP:
+            raise ValueError(f"Compression inconnue: {compression}")
+        self.chemin = chemin
+        self.compression = compression
+        self.noms = []
+        self._fichier = None
+        if fin is None:
+            self._zip = zipfile.ZipFile(chemin, 'w', zipfile.ZIP_DEFLATED)
+            return
+
+        self._fichier = open(chemin, 'r+b')
+        try:
+            entrees = entrees_locales(self._fichier, fin)
+            # Répertoire central et entrées incomplètes de l'archive interrompue
+            self._fichier.seek(fin)
+            self._fichier.truncate()
+            self._zip = zipfile.ZipFile(self._fichier, 'w', zipfile.ZIP_DEFLATED)
+        except Exception:
+            self._fichier.close()
+            raise
+        for info in entrees:
+            self._zip.filelist.append(info)
+            self._zip.NameToInfo[info.filename] = info
+            self.noms.append(info.filename)
+
+    def methode(self, contenu):
+        """(méthode ZIP, niveau deflate) d'un fichier selon la compression choisie"""
+        methode = COMPRESSIONS_ZIP[self.compression]
+        if methode is None:
+            if gain_compression(contenu) >= GAIN_MIN_COMPRESSION:
+                methode = COMPRESSIONS_ZIP['rapide']
+            else:
+                methode = COMPRESSIONS_ZIP['aucune']
+        return methode
+
+    def ajouter(self, nom_fichier, contenu):
+        """Ajoute un PDF (contenu en octets) à l'archive"""
+        compress_type, niveau = self.methode(contenu)
+        self._zip.writestr(nom_fichier, contenu, compress_type=compress_type, compresslevel=niveau)
+        self.noms.append(nom_fichier)
+
+    def position(self):
+        """Taille de l'archive après les PDF ajoutés (à conserver pour la reprendre), transmise au système"""
+        fp = self._zip.fp
+        fp.flush()
+        return fp.tell()
+
+    def synchroniser(self):
+        """Force l'écriture sur disque de ce qui a été transmis au système (voir position)"""
+        os.fsync(self._zip.fp.fileno())
+
+    def fermer(self):
+        self._zip.close()
+        if self._fichier:
+            self._fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+def deplacer_fichier(source, destination):
+    """Déplace un fichier : simple renommage sur le même système de fichiers, copie puis suppression sinon"""
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+    return destination
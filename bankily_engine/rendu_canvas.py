@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Rendu PDF direct sur canvas reportlab, pour les relevés très volumineux
+La grille BANKILY a une mise en page fixe (largeurs de colonnes connues,
+hauteur de ligne constante) : elle est dessinée page par page sans passer par
+le calcul de mise en page des Table platypus, qui mesure chaque cellule.
+"""
+
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import getFont, stringWidth
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.lib.colors import Color
+from reportlab.lib import colors
+
+# Mêmes marges que SimpleDocTemplate dans GenerateurPDF.create_pdf
+MARGE_GAUCHE = 1.5*cm
+MARGE_DROITE = 1.5*cm
+MARGE_HAUT = 2*cm
+MARGE_BAS = 2*cm
+
+# Largeur des blocs en-tête, informations et total (comme en platypus)
+LARGEUR_BLOC = 17*cm
+
+COULEUR_ENTETE = Color(0.7, 0.8, 1.0)
+
+POLICE = 'Helvetica'
+POLICE_GRAS = 'Helvetica-Bold'
+TAILLE_ENTETE = 8
+TAILLE_CORPS = 7
+TAILLE_INFO = 10
+TAILLE_TITRE = 16
+TAILLE_TOTAL = 11
+INTERLIGNE = 1.2
+# Interligne des cellules de tableau (valeur par défaut des Table platypus)
+INTERLIGNE_CELLULE = 12
+PADDING_VERTICAL = 3
+# Fin d'un texte de cellule raccourci à la largeur de sa colonne
+ELLIPSE = '…'
+# Largeur du glyphe le plus large des polices (fraction de la taille) : un
+# texte court tient dans sa colonne sans avoir à le mesurer
+GLYPHE_MAX = max(max(getFont(police).widths) for police in (POLICE, POLICE_GRAS)) / 1000
+
+
+def hauteur_ligne(nb_lignes_texte):
+    """Hauteur d'une ligne de tableau de nb_lignes_texte lignes de texte"""
+    return nb_lignes_texte * INTERLIGNE_CELLULE + 2 * PADDING_VERTICAL
+
+
+def lignes_texte_max(corps):
+    """Nombre de lignes de texte de la cellule la plus haute du corps (au moins 1)"""
+    return max((str(v).count('\n') + 1 for cellules in corps for v in cellules), default=1)
+
+
+def ajuster(texte, largeur_max, police, taille):
+    """Texte raccourci avec ELLIPSE s'il dépasse largeur_max"""
+    if len(texte) * taille * GLYPHE_MAX <= largeur_max or stringWidth(texte, police, taille) <= largeur_max:
+        return texte
+    largeur_max -= stringWidth(ELLIPSE, police, taille)
+    # Plus long début de texte qui tient (recherche dichotomique)
+    bas, haut = 0, len(texte)
+    while bas < haut:
+        milieu = (bas + haut + 1) // 2
+        if stringWidth(texte[:milieu], police, taille) <= largeur_max:
+            bas = milieu
+        else:
+            haut = milieu - 1
+    return texte[:bas].rstrip() + ELLIPSE
+
+
+class RenduCanvas:
+    """Relevé BANKILY dessiné directement sur un canvas, pagination comprise"""
+
+    def __init__(self, chemin, logos=None, titre=""):
+        self.chemin = chemin
+        # Logos BPM et BANKILY préparés (bankily_engine.logos.preparer_logos)
+        self.logos = logos
+        self.titre = titre
+        self.largeur_page, self.hauteur_page = A4
+        self.canvas = canvas.Canvas(chemin, pagesize=A4)
+        self.y = self.hauteur_page - MARGE_HAUT
+
+    def _nouvelle_page(self):
+        self.canvas.showPage()
+        self.y = self.hauteur_page - MARGE_HAUT
+
+    def _x_bloc(self, largeur):
+        """Abscisse d'un bloc centré dans la zone utile"""
+        zone = self.largeur_page - MARGE_GAUCHE - MARGE_DROITE
+        return MARGE_GAUCHE + (zone - largeur) / 2
+
+    def dessiner_entete(self):
+        """Logos (si fournis) puis titre centré"""
+        c = self.canvas
+        if self.logos:
+            logo_bpm, logo_bankily = self.logos
+            x0 = self._x_bloc(LARGEUR_BLOC)
+            hauteur = max(logo_bpm.hauteur, logo_bankily.hauteur)
+            bas = self.y - PADDING_VERTICAL - hauteur
+            # Logo BPM à gauche, logo BANKILY à droite, centrés verticalement
+            logo_bpm.dessiner(c, x0 + 6, bas + (hauteur - logo_bpm.hauteur) / 2)
+            logo_bankily.dessiner(c, x0 + LARGEUR_BLOC - 6 - logo_bankily.largeur,
+                                  bas + (hauteur - logo_bankily.hauteur) / 2)
+            self.y = bas - PADDING_VERTICAL - 20
+
+        self.y -= TAILLE_TITRE * INTERLIGNE
+        c.setFont(POLICE_GRAS, TAILLE_TITRE)
+        c.setFillColor(colors.black)
+        c.drawCentredString(self.largeur_page / 2, self.y, self.titre)
+        self.y -= 15 + 20
+
+    def dessiner_infos(self, lignes, largeur_etiquette=4*cm):
+        """Lignes étiquette : valeur alignées sur une colonne d'étiquettes fixe"""
+        c = self.canvas
+        x0 = self._x_bloc(LARGEUR_BLOC)
+        c.setFont(POLICE, TAILLE_INFO)
+        for etiquette, valeur in lignes:
+            self.y -= TAILLE_INFO * INTERLIGNE + 2
+            c.drawString(x0, self.y, str(etiquette))
+            c.drawString(x0 + largeur_etiquette, self.y, str(valeur))
+            self.y -= 2 + 2
+        self.y -= 20
+
+    def _texte_ligne(self, texte, cellules, x_colonnes, largeurs, alignements,
+                     haut, hauteur, taille, police, padding):
+        """Ajoute une ligne du tableau à l'objet texte de la page"""
+        interligne = INTERLIGNE_CELLULE
+        for valeur, x, largeur, alignement in zip(cellules, x_colonnes, largeurs, alignements):
+            morceaux = str(valeur).split('\n')
+            # Bloc de texte centré verticalement dans la ligne
+            base = haut - (hauteur - len(morceaux) * interligne) / 2 - taille
+            for morceau in morceaux:
+                # Pas de débordement sur les colonnes voisines
+                morceau = ajuster(morceau, largeur - 2 * padding, police, taille)
+                if alignement == 'RIGHT':
+                    x_texte = x + largeur - padding - stringWidth(morceau, police, taille)
+                elif alignement == 'CENTER':
+                    x_texte = x + (largeur - stringWidth(morceau, police, taille)) / 2
+                else:
+                    x_texte = x + padding
+                texte.setTextOrigin(x_texte, base)
+                texte.textOut(morceau)
+                base -= interligne
+
+    def _grille(self, x0, largeurs, haut, bas, bords_lignes):
+        """Traits de la grille d'un morceau de tableau (une page)"""
+        x_fin = x0 + sum(largeurs)
+        traits = [(x0, y, x_fin, y) for y in bords_lignes]
+        x = x0
+        for largeur in [0] + list(largeurs):
+            x += largeur
+            traits.append((x, haut, x, bas))
+        self.canvas.setLineWidth(1)
+        self.canvas.setStrokeColor(colors.black)
+        self.canvas.lines(traits)
+
+    def dessiner_tableau(self, lignes, largeurs, alignements, padding=3):
+        """
+        Tableau des transactions : lignes[0] est l'en-tête, répété en haut de
+        chaque page. Toutes les lignes du corps ont la même hauteur (celle de la
+        cellule la plus haute) ; le texte n'est coupé qu'aux retours à la ligne,
+        et une ligne trop large pour sa colonne est raccourcie (ELLIPSE).
+        """
+        c = self.canvas
+        entete, corps = lignes[0], lignes[1:]
+        x0 = self._x_bloc(sum(largeurs))
+        x_colonnes = [x0 + sum(largeurs[:i]) for i in range(len(largeurs))]
+        hauteur_entete = hauteur_ligne(1)
+        hauteur_corps = hauteur_ligne(lignes_texte_max(corps))
+
+        i = 0
+        while True:
+            # Au moins l'en-tête et une ligne par page
+            if self.y - hauteur_entete - hauteur_corps < MARGE_BAS and i < len(corps):
+                self._nouvelle_page()
+            places = int((self.y - hauteur_entete - MARGE_BAS) // hauteur_corps)
+            morceau = corps[i:i + max(places, 0)]
+
+            haut = self.y
+            bas = haut - hauteur_entete - len(morceau) * hauteur_corps
+
+            # Fond de l'en-tête
+            c.setFillColor(COULEUR_ENTETE)
+            c.rect(x0, haut - hauteur_entete, sum(largeurs), hauteur_entete, stroke=0, fill=1)
+            c.setFillColor(colors.black)
+
+            texte = c.beginText()
+            texte.setFont(POLICE_GRAS, TAILLE_ENTETE)
+            self._texte_ligne(texte, entete, x_colonnes, largeurs, ['CENTER'] * len(entete),
+                              haut, hauteur_entete, TAILLE_ENTETE, POLICE_GRAS, padding)
+            texte.setFont(POLICE, TAILLE_CORPS)
+            y_ligne = haut - hauteur_entete
+            bords = [haut, y_ligne]
+            for cellules in morceau:
+                self._texte_ligne(texte, cellules, x_colonnes, largeurs, alignements,
+                                  y_ligne, hauteur_corps, TAILLE_CORPS, POLICE, padding)
+                y_ligne -= hauteur_corps
+                bords.append(y_ligne)
+            c.drawText(texte)
+            self._grille(x0, largeurs, haut, bas, bords)
+
+            self.y = bas
+            i += len(morceau)
+            if i >= len(corps):
+                break
+            self._nouvelle_page()
+        self.y -= 20
+
+    def dessiner_total(self, texte):
+        """Total aligné à droite sous le tableau"""
+        self.y -= 30 + TAILLE_TOTAL * INTERLIGNE
+        if self.y < MARGE_BAS:
+            self._nouvelle_page()
+            self.y -= TAILLE_TOTAL * INTERLIGNE
+        self.canvas.setFont(POLICE_GRAS, TAILLE_TOTAL)
+        self.canvas.drawRightString(self._x_bloc(LARGEUR_BLOC) + LARGEUR_BLOC - 6, self.y, texte)
+
+    def enregistrer(self):
+        # Nombre de pages du relevé (la page courante est la dernière)
+        self.pages = self.canvas.getPageNumber()
+        self.canvas.save()
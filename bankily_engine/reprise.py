@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+Reprise des générations interrompues (coupure, erreur, bouton Arrêter)
+Chaque génération tient un manifeste : empreinte du fichier Excel, sortie,
+PDF déjà produits et, pour une archive ZIP, taille de l'archive sûrement
+écrite sur disque. Relancée sur le même fichier, la génération reprend au
+premier groupe non terminé en gardant les PDF déjà produits.
+Le manifeste est écrit au plus une fois par INTERVALLE_SAUVEGARDE_S (une
+écriture différée prend en compte les derniers PDF, même pendant le rendu
+d'un long groupe) : les PDF produits juste avant une coupure sont rendus de nouveau (dans un dossier,
+leur première copie reste à côté de la nouvelle).
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime
+
+from bankily_engine.cache import DOSSIER_CACHE, dossier_application, empreinte_avec_index, empreinte_fichier
+from bankily_engine.rapport import COMPRESSION_ZIP_DEFAUT, ArchiveZip
+
+DOSSIER_REPRISES = os.path.join(dossier_application(), 'reprises')
+
+# Version du format des manifestes : un manifeste d'une autre version est ignoré
+VERSION_REPRISE = 1
+
+# Écart minimal entre deux sauvegardes du manifeste pendant la génération
+INTERVALLE_SAUVEGARDE_S = 1.0
+
+# Manifestes de générations jamais reprises supprimés après cette durée
+DUREE_VIE_REPRISE_JOURS = 30
+
+
+def nettoyer_reprises(dossier=DOSSIER_REPRISES, duree_vie_jours=DUREE_VIE_REPRISE_JOURS):
+    """Supprime les manifestes périmés"""
+    limite = time.time() - duree_vie_jours * 86400
+    try:
+        noms = os.listdir(dossier)
+    except OSError:
+        return
+    for nom in noms:
+        chemin = os.path.join(dossier, nom)
+        try:
+            if os.stat(chemin).st_mtime < limite:
+                os.remove(chemin)
+        except OSError:
+            pass
+
+
+class Reprise:
+    """Manifeste de la génération d'un fichier Excel pour un type de rapport"""
+
+    def __init__(self, chemin, type_rapport, fichier, empreinte, donnees=None):
+        donnees = donnees or {}
+        self.chemin = chemin
+        self.type_rapport = type_rapport
+        self.fichier = os.path.abspath(fichier)
+        self.empreinte = empreinte
+        # Sortie de la génération (archive ZIP ou dossier)
+        self.sortie = donnees.get('sortie')
+        # Groupe : PDF produit (nom dans l'archive, ou chemin dans le dossier)
+        self.termines = dict(donnees.get('termines', {}))
+        # Octets de l'archive couverts par les PDF de termines
+        self.fin_archive = donnees.get('fin_archive', 0)
+        self.debut = donnees.get('debut')
+        self.archive = None
+        self._derniere_sauvegarde = 0.0
+        # PDF notés depuis la dernière sauvegarde
+        self._modifie = False
+        # Sauvegarde différée en attente (threading.Timer), None si aucune
+        self._minuterie = None
+        # Sauvegardes (thread de génération ou minuterie) une à la fois
+        self._verrou = threading.Lock()
+        # Faux si le manifeste n'a pas pu être écrit : génération sans reprise
+        self.active = True
+        self._journal = lambda message: None
+
+    @classmethod
+    def pour_fichier(cls, type_rapport, fichier, dossier=DOSSIER_REPRISES):
+        """Manifeste de ce fichier (même contenu), vide si aucune génération n'a été interrompue"""
+        # Empreinte déjà connue de l'index du cache si le fichier n'a pas changé depuis sa lecture
+        try:
+            os.makedirs(DOSSIER_CACHE, exist_ok=True)
+            empreinte = empreinte_avec_index(fichier, DOSSIER_CACHE)
+        except OSError:
+            empreinte = empreinte_fichier(fichier)
+        chemin = os.path.join(dossier, f"{type_rapport}_{empreinte}.json")
+        try:
+            with open(chemin, 'r', encoding='utf-8') as f:
+                donnees = json.load(f)
+        except (OSError, ValueError):
+            donnees = None
+        if donnees and donnees.get('version') != VERSION_REPRISE:
+            donnees = None
+        return cls(chemin, type_rapport, fichier, empreinte, donnees)
+
+    @property
+    def interrompue(self):
+        """Génération précédente inachevée, dont la sortie existe encore"""
+        return bool(self.termines) and bool(self.sortie) and os.path.exists(self.sortie)
+
+    def termine(self, nom):
+        return str(nom) in self.termines
+
+    def pdf(self, nom):
+        return self.termines[str(nom)]
+
+    def ouvrir(self, sortie, reprendre=False, compression=COMPRESSION_ZIP_DEFAUT, journal=None):
+        """
+        Prépare la sortie (ArchiveZip ouverte si sortie est un .zip, dossier
+        sinon), en gardant les PDF de la génération interrompue si reprendre.
+        Une archive interrompue illisible est recommencée.
+        """
+        journal = journal or (lambda message: None)
+        self._journal = journal
+        self.active = True
+        sortie = os.path.abspath(sortie)
+        if not (reprendre and self.interrompue and sortie == self.sortie):
+            self.termines = {}
+            self.fin_archive = 0
+            self.debut = datetime.now().isoformat(timespec='seconds')
+        self.sortie = sortie
+        nettoyer_reprises(os.path.dirname(self.chemin))
+
+        if not sortie.lower().endswith('.zip'):
+            os.makedirs(sortie, exist_ok=True)
+            # PDF effacés du dossier depuis l'interruption : à refaire
+            self.termines = {nom: pdf for nom, pdf in self.termines.items() if os.path.exists(pdf)}
+            self.archive = None
+            self.sauvegarder(force=True)
+            return sortie
+
+        archive = None
+        if self.termines:
+            try:
+                archive = ArchiveZip(sortie, compression, fin=self.fin_archive)
+                if sorted(archive.noms) != sorted(self.termines.values()):
+                    archive.fermer()
+                    raise ValueError("contenu différent du manifeste")
+            except (OSError, ValueError) as e:
+                journal(f"⚠️ Archive interrompue illisible ({e}): génération recommencée")
+                archive = None
+                self.termines = {}
+        self.archive = archive or ArchiveZip(sortie, compression)
+        self.fin_archive = self.archive.position()
+        self.sauvegarder(force=True)
+        return self.archive
+
+    def enregistrer(self, nom, pdf):
+        """Note un PDF produit (ajouté à l'archive ou écrit dans le dossier), par le thread de génération"""
+        with self._verrou:
+            self.termines[str(nom)] = pdf
+            if self.archive:
+                # Relevée ici : seul ce thread écrit dans l'archive
+                self.fin_archive = self.archive.position()
+            self._modifie = True
+        self.sauvegarder()
+
+    def sauvegarder(self, force=False):
+        """
+        Écrit le manifeste, au plus une fois par INTERVALLE_SAUVEGARDE_S sauf
+        si force ; plus tôt, l'écriture est différée à la fin de l'intervalle.
+        L'archive est d'abord écrite sur disque : le manifeste ne cite jamais
+        un PDF qu'une coupure aurait perdu.
+        """
+        with self._verrou:
+            if not self.active or (not force and not self._modifie):
+                return
+            attente = INTERVALLE_SAUVEGARDE_S - (time.monotonic() - self._derniere_sauvegarde)
+            if not force and attente > 0:
+                if self._minuterie is None:
+                    self._minuterie = threading.Timer(attente, self._sauvegarde_differee)
+                    self._minuterie.daemon = True
+                    self._minuterie.start()
+                return
+            self._ecrire()
+
+    def _sauvegarde_differee(self):
+        with self._verrou:
+            self._minuterie = None
+        try:
+            self.sauvegarder()
+        except (OSError, ValueError):
+            # Archive fermée entre-temps : la fin de génération sauvegarde elle-même
+            pass
+
+    def _ecrire(self):
+        """
+        Écrit le manifeste (verrou tenu). S'il ne peut pas l'être (dossier en
+        lecture seule...), la génération continue sans reprise possible.
+        """
+        self._derniere_sauvegarde = time.monotonic()
+        self._modifie = False
+        try:
+            self._ecrire_manifeste()
+        except OSError as e:
+            self.active = False
+            self._journal(f"⚠️ Reprise indisponible pour cette génération: {e}")
+
+    def _ecrire_manifeste(self):
+        if self.archive:
+            self.archive.synchroniser()
+
+        donnees = {
+            'version': VERSION_REPRISE,
+            'type_rapport': self.type_rapport,
+            'fichier': self.fichier,
+            'empreinte': self.empreinte,
+            'sortie': self.sortie,
+            'debut': self.debut,
+            'mise_a_jour': datetime.now().isoformat(timespec='seconds'),
+            'fin_archive': self.fin_archive,
+            'termines': dict(self.termines),
+        }
+        os.makedirs(os.path.dirname(self.chemin), exist_ok=True)
+        chemin_tmp = self.chemin + '.tmp'
+        with open(chemin_tmp, 'w', encoding='utf-8') as f:
+            json.dump(donnees, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(chemin_tmp, self.chemin)
+
+    def terminer(self, complete):
+        """
+        Fin de la génération (archive encore ouverte) : manifeste supprimé si
+        tous les PDF sont produits, sauvegardé pour une reprise sinon
+        """
+        if not complete:
+            self.sauvegarder(force=True)
+            return
+        with self._verrou:
+            if self._minuterie:
+                self._minuterie.cancel()
+                self._minuterie = None
+            self._modifie = False
+            self.termines = {}
+            self.archive = None
+            try:
+                os.remove(self.chemin)
+            except OSError:
+                pass
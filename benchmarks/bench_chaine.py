@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Débit de la chaîne complète par type de rapport sur des classeurs synthétiques
+(donnees_synthetiques.py) : lecture Excel, relecture depuis le cache Parquet,
+regroupement, rendu des PDF et écriture de l'archive ZIP.
+Chaque mesure est ajoutée à benchmarks/resultats/chaine.jsonl avec la version
+du code, et comparée à la mesure précédente de la même configuration.
+
+    python benchmarks/bench_chaine.py --tailles 10000,100000
+    python benchmarks/bench_chaine.py --types agents --tailles 1000000 --moteur canvas
+"""
+
+import os
+import sys
+import json
+import platform
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from donnees_synthetiques import classeur_synthetique  # noqa: E402
+
+from bankily_engine.agents import lire_fichier_agents  # noqa: E402
+from bankily_engine.cache import charger_avec_cache  # noqa: E402
+from bankily_engine.centres import lire_fichier_centres  # noqa: E402
+from bankily_engine.cli import NB_PROCESSUS_DEFAUT, TYPES_RAPPORT  # noqa: E402
+from bankily_engine.commercants import lire_fichier_commercants  # noqa: E402
+from bankily_engine.mesures import Mesures  # noqa: E402
+from bankily_engine.rapport import MOTEURS, ArchiveZip, generer_rapports  # noqa: E402
+
+DOSSIER = os.path.dirname(os.path.abspath(__file__))
+# Classeurs générés (réutilisés d'une exécution à l'autre, hors dépôt)
+DOSSIER_DONNEES = os.path.join(DOSSIER, 'donnees')
+FICHIER_RESULTATS = os.path.join(DOSSIER, 'resultats', 'chaine.jsonl')
+
+# Lecture Excel de chaque type de rapport (sans le cache de l'application)
+LECTEURS = {
+    'centres': lire_fichier_centres,
+    'commercants': lire_fichier_commercants,
+    'agents': lire_fichier_agents,
+}
+
+TAILLES_DEFAUT = "10000,100000"
+
+# Étapes comparées d'une version à l'autre (voir bankily_engine.mesures)
+ETAPES = ['lecture_excel', 'chargement_cache', 'analyse', 'generation', 'ecriture_zip', 'fermeture_zip']
+
+
+def version_code():
+    """Commit courant (suffixe + si l'arbre est modifié), 'inconnue' hors dépôt git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DOSSIER,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        modifie = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=DOSSIER,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ('+' if modifie else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'inconnue'
+
+
+def mesurer(type_rapport, chemin, moteur, nb_processus, rendu=True):
+    """Mesures d'une exécution de la chaîne sur le classeur chemin"""
+    classe = TYPES_RAPPORT[type_rapport]
+    mesures = Mesures()
+    with tempfile.TemporaryDirectory() as dossier:
+        # Première lecture : Excel puis mise en cache ; seconde : depuis le cache
+        cache = os.path.join(dossier, 'cache')
+        with mesures.etape('lecture_excel'):
+            charger_avec_cache(chemin, LECTEURS[type_rapport], type_rapport, dossier=cache)
+        with mesures.etape('chargement_cache'):
+            df = charger_avec_cache(chemin, LECTEURS[type_rapport], type_rapport, dossier=cache)
+        with mesures.etape('analyse'):
+            _, groupes = classe.analyser(df)
+
+        taille_archive = None
+        if rendu:
+            chemin_zip = os.path.join(dossier, 'rapports.zip')
+            archive = ArchiveZip(chemin_zip)
+            try:
+                with mesures.etape('generation'):
+                    generer_rapports(classe, groupes, archive, nb_processus=nb_processus,
+                                     moteur=moteur, mesures=mesures)
+            finally:
+                with mesures.etape('fermeture_zip'):
+                    archive.fermer()
+            taille_archive = os.path.getsize(chemin_zip)
+
+    rapport = mesures.rapport(type_rapport=type_rapport, lignes=len(df), nb_groupes=len(groupes),
+                              moteur=moteur or classe.MOTEUR, processus=nb_processus,
+                              taille_archive=taille_archive)
+    # Détail par groupe inutile pour comparer des versions
+    del rapport['groupes']
+    return rapport
+
+
+def precedent(resultats, rapport):
+    """Dernière mesure enregistrée de la même configuration"""
+    cle = ('type_rapport', 'lignes', 'moteur', 'processus')
+    for ancien in reversed(resultats):
+        if all(ancien.get(c) == rapport[c] for c in cle):
+            return ancien
+    return None
+
+
+def lire_resultats(chemin):
+    if not os.path.exists(chemin):
+        return []
+    with open(chemin, encoding='utf-8') as f:
+        return [json.loads(ligne) for ligne in f if ligne.strip()]
+
+
+def afficher(rapport, ancien):
+    """Durées par étape, débit, et écart avec la mesure précédente"""
+    print(f"{rapport['type_rapport']} : {rapport['lignes']} lignes, {rapport['nb_groupes']} groupes, "
+          f"moteur {rapport['moteur']}, {rapport['processus']} processus")
+    for etape in ETAPES:
+        duree = rapport['etapes'].get(etape)
+        if duree is None:
+            continue
+        ligne = f"  {etape:<18}{duree:9.2f} s  {rapport['lignes'] / max(duree, 1e-9):12.0f} lignes/s"
+        avant = ancien and ancien['etapes'].get(etape)
+        if avant:
+            ligne += f"  ({(duree - avant) / avant:+.0%} vs {ancien['version']})"
+        print(ligne)
+    if rapport['taille_archive'] is not None:
+        print(f"  {rapport['totaux']['pages']} pages, archive {rapport['taille_archive'] / 1024 / 1024:.1f} Mo")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Débit de la chaîne complète sur données synthétiques")
+    parser.add_argument('--types', default=",".join(TYPES_RAPPORT),
+                        help="Types de rapport séparés par des virgules (défaut : tous)")
+    parser.add_argument('--tailles', default=TAILLES_DEFAUT,
+                        help=f"Nombres de lignes séparés par des virgules (défaut : {TAILLES_DEFAUT})")
+    parser.add_argument('--moteur', choices=MOTEURS, help="Moteur de rendu (défaut : celui du type)")
+    parser.add_argument('--processus', type=int, default=NB_PROCESSUS_DEFAUT,
+                        help=f"Processus de rendu (défaut : {NB_PROCESSUS_DEFAUT})")
+    parser.add_argument('--sans-rendu', action='store_true',
+                        help="Lecture et regroupement seulement (pas de PDF ni de ZIP)")
+    parser.add_argument('--resultats', default=FICHIER_RESULTATS,
+                        help="Fichier JSON Lines des mesures (défaut : benchmarks/resultats/chaine.jsonl)")
+    args = parser.parse_args(argv)
+
+    types = [t.strip() for t in args.types.split(',') if t.strip()]
+    inconnus = [t for t in types if t not in TYPES_RAPPORT]
+    if inconnus:
+        parser.error(f"types inconnus : {', '.join(inconnus)}")
+    tailles = [int(t) for t in args.tailles.split(',') if t.strip()]
+
+    resultats = lire_resultats(args.resultats)
+    contexte = {
+        'version': version_code(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plateforme': platform.platform(),
+        'processeurs': os.cpu_count(),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.resultats)), exist_ok=True)
+    for type_rapport in types:
+        for nb_lignes in tailles:
+            chemin = classeur_synthetique(type_rapport, nb_lignes, DOSSIER_DONNEES)
+            rapport = {**contexte, **mesurer(type_rapport, chemin, args.moteur, max(1, args.processus),
+                                             rendu=not args.sans_rendu)}
+            afficher(rapport, precedent(resultats, rapport))
+            resultats.append(rapport)
+            with open(args.resultats, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(rapport, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
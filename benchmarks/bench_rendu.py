@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Compare les moteurs de rendu PDF (platypus, pages, canvas) sur un relevé agent
+synthétique de grande taille.
+
+    python benchmarks/bench_rendu.py --lignes 50000
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bankily_engine.agents import GenerateurPDFAgents  # noqa: E402
+from bankily_engine.rapport import MOTEURS  # noqa: E402
+
+
+def releve_synthetique(nb_lignes, graine=0):
+    """Transactions d'un seul agent, au format produit par charger_agents"""
+    rng = np.random.default_rng(graine)
+    debut = pd.Timestamp("2025-06-01")
+    return pd.DataFrame({
+        'DATE_TRS': debut + pd.to_timedelta(np.sort(rng.integers(0, 30 * 86400, nb_lignes)), unit='s'),
+        'ID_TRS': [f"{v:018d}" for v in rng.integers(0, 10**17, nb_lignes)],
+        'TYPE_OPERATION': rng.choice(['CASH_IN', 'CASH_OUT', 'PAIEMENT'], nb_lignes),
+        'CLIENT': [f"{v:08d}" for v in rng.integers(20000000, 50000000, nb_lignes)],
+        'COMMISSION': rng.integers(10, 500, nb_lignes) / 10,
+        'MONTANT': rng.integers(100, 100000, nb_lignes).astype(float),
+        'CODE_AGENT': "00001",
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps de rendu d'un relevé par moteur")
+    parser.add_argument('--lignes', type=int, default=20000, help="Transactions du relevé (défaut : 20000)")
+    parser.add_argument('--repetitions', type=int, default=1, help="Rendus par moteur (meilleur temps retenu)")
+    args = parser.parse_args(argv)
+
+    df = releve_synthetique(args.lignes)
+    with tempfile.TemporaryDirectory() as dossier:
+        for moteur in MOTEURS:
+            generateur = GenerateurPDFAgents(moteur=moteur)
+            temps = []
+            for _ in range(args.repetitions):
+                debut = time.perf_counter()
+                chemin = generateur.create_pdf("00001", df, dossier)
+                temps.append(time.perf_counter() - debut)
+                if not chemin:
+                    print(f"{moteur:>9} : échec {generateur.messages[-1:]}")
+                    return 1
+                taille = os.path.getsize(chemin)
+                os.remove(chemin)
+            print(f"{moteur:>9} : {min(temps):7.2f} s  {taille / 1024:8.0f} Ko  ({args.lignes} lignes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
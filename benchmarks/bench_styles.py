@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Coût de construction des relevés hors rendu (styles, tableaux) sur un grand
+nombre de petits groupes : temps, mémoire allouée au pic et objets TableStyle
+créés, par type de rapport (deux passes de construction).
+Avec --reference, les styles sont reconstruits à chaque appel comme avant
+leur partage, pour comparer les deux constructions.
+
+    python benchmarks/bench_styles.py --groupes 1000
+    python benchmarks/bench_styles.py --groupes 1000 --reference
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.platypus import tables  # noqa: E402
+
+from bankily_engine import rapport, centres  # noqa: E402
+from bankily_engine.cli import TYPES_RAPPORT  # noqa: E402
+
+
+def transactions_synthetiques(classe, nb_groupes, lignes_par_groupe, graine=0):
+    """Petits groupes au format produit par classe.charger"""
+    rng = np.random.default_rng(graine)
+    n = nb_groupes * lignes_par_groupe
+    dates = pd.Timestamp("2025-06-01") + pd.to_timedelta(rng.integers(0, 30 * 86400, n), unit='s')
+    df = pd.DataFrame({
+        'ID': [f"{v:018d}" for v in rng.integers(0, 10**17, n)],
+        'ID_TRS': [f"{v:018d}" for v in rng.integers(0, 10**17, n)],
+        'DATEP': dates,
+        'DATE_TRS': dates,
+        'TYPE_OPERATION': rng.choice(['CASH_IN', 'CASH_OUT', 'PAIEMENT'], n),
+        'CLIENT': [f"{v:08d}" for v in rng.integers(20000000, 50000000, n)],
+        'COMMISSION': rng.integers(10, 500, n) / 10,
+        'MONTANT': rng.integers(100, 100000, n).astype(float),
+    })
+    df[classe.COLONNE_GROUPE] = np.repeat([f"G{i:05d}" for i in range(nb_groupes)], lignes_par_groupe)
+    return classe.analyser(df)[1]
+
+
+def compter_styles():
+    """Compte les TableStyle créés (constructeur instrumenté)"""
+    compteur = [0]
+    init = tables.TableStyle.__init__
+
+    def init_compte(self, *args, **kwargs):
+        compteur[0] += 1
+        init(self, *args, **kwargs)
+
+    tables.TableStyle.__init__ = init_compte
+    return compteur, lambda: setattr(tables.TableStyle, '__init__', init)
+
+
+def styles_par_appel():
+    """
+    Mode référence : feuille de styles construite par générateur et TableStyle
+    construit par tableau, comme avant leur partage
+    """
+    remplacements = []
+
+    def remplacer(objet, attribut, valeur):
+        remplacements.append((objet, attribut, getattr(objet, attribut)))
+        setattr(objet, attribut, valeur)
+
+    def style_par_appel(classe, methode, module, constante, si=lambda generateur: True):
+        """Constante de style reconstruite avant chaque appel de classe.methode qui l'utilise (si)"""
+        origine = getattr(classe, methode)
+        commandes = getattr(module, constante).getCommands()
+
+        def appel(self, *args, **kwargs):
+            if si(self):
+                setattr(module, constante, tables.TableStyle(list(commandes)))
+            return origine(self, *args, **kwargs)
+        remplacer(module, constante, getattr(module, constante))
+        remplacer(classe, methode, appel)
+
+    def add_tableau(self, story, nom, data):
+        classe = type(self)
+        self.style_transactions = rapport.style_tableau(
+            classe.ALIGNEMENTS,
+            padding_horizontal=classe.PADDING_TABLEAU,
+            wordwrap=classe.WORDWRAP_TABLEAU
+        )
+        return origine_tableau(self, story, nom, data)
+
+    origine_tableau = rapport.GenerateurPDF.add_tableau
+    remplacer(rapport, 'feuille_styles', rapport.feuille_styles.__wrapped__)
+    remplacer(rapport.GenerateurPDF, 'add_tableau', add_tableau)
+    style_par_appel(rapport.GenerateurPDF, 'add_header', rapport, 'STYLE_LOGOS',
+                    si=lambda generateur: generateur.logos)
+    style_par_appel(rapport.GenerateurPDF, 'add_summary', rapport, 'STYLE_TOTAL')
+    style_par_appel(centres.GenerateurPDFCentres, 'add_table', centres, 'STYLE_INFO_CENTRE')
+
+    def restaurer():
+        for objet, attribut, valeur in reversed(remplacements):
+            setattr(objet, attribut, valeur)
+    return restaurer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Coût des styles et tableaux par relevé")
+    parser.add_argument('--groupes', type=int, default=1000, help="Nombre de groupes (défaut : 1000)")
+    parser.add_argument('--lignes', type=int, default=5, help="Transactions par groupe (défaut : 5)")
+    parser.add_argument('--reference', action='store_true',
+                        help="Styles reconstruits à chaque appel, comme avant leur partage")
+    args = parser.parse_args(argv)
+
+    restaurer_styles = styles_par_appel() if args.reference else (lambda: None)
+    try:
+        mesurer(args)
+    finally:
+        restaurer_styles()
+    return 0
+
+
+def mesurer(args):
+    """Construit deux fois les relevés de chaque type de rapport et affiche les mesures"""
+    for type_rapport, classe in TYPES_RAPPORT.items():
+        groupes = transactions_synthetiques(classe, args.groupes, args.lignes)
+
+        def construire():
+            # Générateur créé comme dans un processus de rendu, puis un récit par groupe
+            generateur = classe()
+            for nom, data in groupes.items():
+                story = []
+                generateur.add_header(story)
+                generateur.add_contenu(story, nom, data)
+
+        # TableStyle créés sur deux passes : la première mesure le temps (sans
+        # traçage), la seconde la mémoire allouée au pic
+        compteur, restaurer = compter_styles()
+        try:
+            debut = time.perf_counter()
+            construire()
+            duree = time.perf_counter() - debut
+
+            tracemalloc.start()
+            construire()
+            _, pic = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            restaurer()
+        print(f"{type_rapport:>12} : {duree:6.2f} s  pic {pic / 1024:8.0f} Ko  "
+              f"{compteur[0]:6d} TableStyle  ({args.groupes} groupes"
+              f"{', référence' if args.reference else ''})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Classeurs Excel synthétiques au format des extractions BANKILY, pour mesurer
+la chaîne complète de façon reproductible (même graine : même fichier).
+Tailles de groupes très inégales (loi de Zipf) : quelques centres, commerçants
+ou agents concentrent la plupart des transactions, comme en production.
+
+    python benchmarks/donnees_synthetiques.py agents 100000 --sortie agents_100k.xlsx
+"""
+
+import os
+import sys
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Transactions par groupe en moyenne (nombre de groupes = lignes / moyenne)
+LIGNES_PAR_GROUPE = {
+    'centres': 2000,
+    'commercants': 300,
+    'agents': 150,
+}
+
+# Exposant de la loi de Zipf des tailles de groupes (1 : très inégales)
+EXPOSANT_ZIPF = 1.1
+
+# Mois couvert par l'extraction
+DEBUT_PERIODE = pd.Timestamp("2025-06-01")
+JOURS_PERIODE = 30
+
+TYPES_OPERATION = ['CASH_IN', 'CASH_OUT', 'PAIEMENT', 'TRANSFERT']
+
+
+def nombre_groupes(type_rapport, nb_lignes):
+    return max(3, nb_lignes // LIGNES_PAR_GROUPE[type_rapport])
+
+
+def tailles_inegales(rng, nb_lignes, nb_groupes):
+    """Indice de groupe de chaque ligne, le groupe de rang k pesant 1 / k^EXPOSANT_ZIPF"""
+    poids = 1 / np.arange(1, nb_groupes + 1) ** EXPOSANT_ZIPF
+    indices = rng.choice(nb_groupes, size=nb_lignes, p=poids / poids.sum())
+    # Les groupes ne sont pas rangés par taille dans le fichier
+    return rng.permutation(nb_groupes)[indices]
+
+
+def dates_oracle(dates):
+    """Dates au format texte des extractions Oracle ("10-JUN-25 12.49.35.212000 PM")"""
+    return dates.dt.strftime('%d-%b-%y %I.%M.%S.%f %p').str.upper()
+
+
+def transactions(type_rapport, nb_lignes, graine=0, nb_groupes=None):
+    """DataFrame des colonnes du fichier Excel d'un type de rapport (valeurs telles qu'écrites)"""
+    rng = np.random.default_rng(graine)
+    nb_groupes = nb_groupes or nombre_groupes(type_rapport, nb_lignes)
+    groupes = tailles_inegales(rng, nb_lignes, nb_groupes)
+    dates = pd.Series(DEBUT_PERIODE + pd.to_timedelta(
+        rng.integers(0, JOURS_PERIODE * 86400 * 10**6, nb_lignes), unit='us'
+    ))
+    identifiants = [f"{v:019d}" for v in rng.integers(0, 10**18, nb_lignes)]
+    clients = rng.integers(20000000, 50000000, nb_lignes)
+    montants = rng.integers(100, 100000, nb_lignes)
+
+    if type_rapport == 'agents':
+        return pd.DataFrame({
+            'DATE_TRS': dates_oracle(dates),
+            'ID_TRS': [i[4:] for i in identifiants],
+            'TYPE_OPERATION': rng.choice(TYPES_OPERATION, nb_lignes),
+            'TEL_CLIENT': clients,
+            'CLIENT': [f"{v:08d}" for v in rng.integers(0, 10**7, nb_lignes)],
+            'COMMISSION': rng.integers(1, 200, nb_lignes) / 10,
+            'MONTANT': montants,
+            'CODE_AGENT': np.array([f"{i:05d}" for i in range(1, nb_groupes + 1)])[groupes],
+        })
+
+    if type_rapport == 'centres':
+        noms = np.array([f"CENTRE {i:03d}" for i in range(1, nb_groupes + 1)])
+    else:
+        noms = np.array([f"COMMERCE {i:04d}" for i in range(1, nb_groupes + 1)])
+    return pd.DataFrame({
+        'ID': identifiants,
+        'DATEP': dates.dt.floor('min'),
+        'CLIENT': clients,
+        'MONTANT': montants,
+        'CENTRE' if type_rapport == 'centres' else 'COMMERCANT': noms[groupes],
+    })
+
+
+def ecrire_classeur(df, chemin):
+    """Écrit le DataFrame en .xlsx (openpyxl en écriture seule, une feuille)"""
+    import openpyxl
+
+    classeur = openpyxl.Workbook(write_only=True)
+    feuille = classeur.create_sheet()
+    feuille.append(list(df.columns))
+    # tolist : valeurs Python natives (Timestamp pour les dates, écrites en dates Excel)
+    for ligne in zip(*(serie.tolist() for _, serie in df.items())):
+        feuille.append(ligne)
+    chemin_tmp = chemin + '.tmp'
+    classeur.save(chemin_tmp)
+    os.replace(chemin_tmp, chemin)
+    return chemin
+
+
+def classeur_synthetique(type_rapport, nb_lignes, dossier, graine=0):
+    """Chemin du classeur synthétique, généré seulement s'il n'existe pas déjà dans dossier"""
+    os.makedirs(dossier, exist_ok=True)
+    chemin = os.path.join(dossier, f"{type_rapport}_{nb_lignes}_g{graine}.xlsx")
+    if not os.path.exists(chemin):
+        ecrire_classeur(transactions(type_rapport, nb_lignes, graine), chemin)
+    return chemin
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère un classeur Excel synthétique BANKILY")
+    parser.add_argument('type_rapport', choices=list(LIGNES_PAR_GROUPE))
+    parser.add_argument('lignes', type=int, help="Nombre de transactions")
+    parser.add_argument('--sortie', help="Fichier .xlsx (défaut : <type>_<lignes>.xlsx)")
+    parser.add_argument('--graine', type=int, default=0, help="Graine aléatoire (défaut : 0)")
+    parser.add_argument('--groupes', type=int, help="Nombre de groupes (défaut : selon le type)")
+    args = parser.parse_args(argv)
+
+    sortie = args.sortie or f"{args.type_rapport}_{args.lignes}.xlsx"
+    df = transactions(args.type_rapport, args.lignes, args.graine, args.groupes)
+    ecrire_classeur(df, sortie)
+    print(f"{sortie} : {len(df)} lignes, {df.iloc[:, -1].nunique()} groupes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,22 @@ a = Analysis(
         'pandas.io.excel._xlrd',
         'openpyxl',
         'xlrd',
+        'pyarrow',
+        'pandas.io.parquet',
+        'bankily_engine',
+        'bankily_engine.cache',
+        'bankily_engine.ingestion',
+        'bankily_engine.logos',
+        'bankily_engine.rapport',
+        'bankily_engine.rendu_canvas',
+        'bankily_engine.mesures',
+        'bankily_engine.annulation',
+        'bankily_engine.reprise',
+        'bankily_engine.generation',
+        'bankily_engine.cache_pdf',
+        'bankily_engine.pompe',
+        'bankily_engine.centres',
+        'interface_multi',
         'reportlab',
         'reportlab.platypus',
         'reportlab.platypus.doctemplate',
@@ -36,6 +52,8 @@ a = Analysis(
         'tkcalendar',
         'tempfile',
         'threading',
+        'multiprocessing',
+        'concurrent.futures',
         'zipfile',
         'shutil',
         'datetime',
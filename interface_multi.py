@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Interface Graphique commune des générateurs de rapports PDF BANKILY
+Chaque générateur (centres, commerçants, agents) en hérite en indiquant sa
+classe de rapport et ses libellés ; la génération elle-même est celle de
+bankily_engine.generation, partagée avec la ligne de commande.
+"""
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, scrolledtext
+import os
+import threading
+
+# Moteur de rapports (pandas, reportlab)
+try:
+    from bankily_engine.rapport import deplacer_fichier, nom_zip
+    from bankily_engine.generation import FichierInvalide, analyser_fichier, generer_sortie
+    from bankily_engine.pompe import PompeInterface
+    from bankily_engine.mesures import Mesures, chemin_rapport
+    from bankily_engine.annulation import Annulation, JetonAnnulation
+    from bankily_engine.reprise import Reprise
+    from bankily_engine.cache_pdf import DOSSIER_CACHE_PDF
+    REPORTLAB_OK = True
+except ImportError as e:
+    print(f"Erreur d'import: {e}")
+    REPORTLAB_OK = False
+
+# Processus de rendu par défaut (un cœur reste libre pour l'interface)
+NB_PROCESSUS_DEFAUT = max(1, (os.cpu_count() or 1) - 1)
+
+
+class RapportMultiGUI:
+    """
+    Fenêtre d'un générateur : les sous-classes renseignent les attributs
+    ci-dessous et ligne_groupe()
+    """
+    
+    # Générateur du type de rapport (sous-classe de bankily_engine.rapport.GenerateurPDF)
+    CLASSE = None
+    # Titre ("Multi-Agents"), icône de la fenêtre et de la liste des groupes
+    TITRE = ""
+    ICONE = ""
+    ICONE_GROUPES = ""
+    # Groupe au singulier et au pluriel dans les libellés ("agent", "agents")
+    GROUPE = ""
+    GROUPES = ""
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title(f"{self.ICONE} Générateur de Rapports {self.TITRE} - BANKILY")
+        self.root.geometry("900x700")
+        self.root.configure(bg='#f0f0f0')
+        
+        # Variables
+        self.fichier_excel = None
+        self.logo_bpm = None
+        self.logo_bankily = None
+        self.processing = False
+        self.groupes_data = {}
+        # Durées du chargement et de l'analyse, reprises dans les mesures de la génération
+        self.mesures_analyse = None
+        # Analyse en arrière-plan en cours (None si aucune)
+        self.jeton_analyse = None
+        # Génération en cours, arrêtable par le bouton Arrêter (None si aucune)
+        self.jeton_generation = None
+        # Manifeste du fichier analysé : génération interrompue à reprendre éventuellement
+        self.reprise = None
+        # Dernière archive générée (bouton Déplacer ZIP)
+        self.zip_path = None
+        
+        # Vérification des dépendances
+        if not REPORTLAB_OK or self.CLASSE is None:
+            self.show_dependency_error()
+            return
+        
+        # Interface
+        self.create_interface()
+        
+        # Journal et progression alimentés par les threads, affichés par lots
+        self.pompe = PompeInterface(self.root, self.log_text, self.progress)
+        self.pompe.demarrer()
+        
+        # Vérifier logos
+        self.check_logos()
+    
+    @property
+    def texte_generer(self):
+        """Libellé du bouton de génération"""
+        return f"🚀 Générer Rapports par {self.GROUPE.capitalize()}"
+    
+    def ligne_groupe(self, nom, nb, total):
+        """Ligne d'un groupe dans la liste (nombre de transactions, total de COLONNE_TOTAL)"""
+        raise NotImplementedError
+    
+    def diagnostic(self, df):
+        """Contrôles propres au type de rapport sur le fichier lu, notés au journal"""
+    
+    def show_dependency_error(self):
+        """Affiche erreur dépendances"""
+        error_frame = tk.Frame(self.root, bg='#e74c3c', padx=20, pady=20)
+        error_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        tk.Label(
+            error_frame,
+            text="❌ ERREUR DE DÉPENDANCES",
+            font=('Arial', 16, 'bold'),
+            fg='white',
+            bg='#e74c3c'
+        ).pack(pady=10)
+        
+        tk.Label(
+            error_frame,
+            text="pip install pandas openpyxl xlrd reportlab tkcalendar",
+            font=('Courier', 10),
+            fg='white',
+            bg='#c0392b',
+            relief='sunken',
+            padx=10,
+            pady=10
+        ).pack(pady=10)
+    
+    def create_interface(self):
+        """Crée l'interface"""
+        # Titre
+        title_frame = tk.Frame(self.root, bg='#2c3e50', height=70)
+        title_frame.pack(fill='x', padx=10, pady=10)
+        title_frame.pack_propagate(False)
+        
+        tk.Label(
+            title_frame,
+            text=f"{self.ICONE} Générateur de Rapports {self.TITRE}",
+            font=('Arial', 18, 'bold'),
+            fg='white',
+            bg='#2c3e50'
+        ).pack(expand=True)
+        
+        # Sections
+        self.create_logo_section()
+        self.create_file_section()
+        self.create_groupes_section()
+        self.create_controls()
+        self.create_log_section()
+        self.create_progress()
+    
+    def create_logo_section(self):
+        """Section logos"""
+        frame = tk.LabelFrame(
+            self.root,
+            text="📷 Logos",
+            font=('Arial', 10, 'bold'),
+            bg='#f0f0f0'
+        )
+        frame.pack(fill='x', padx=10, pady=5)
+        
+        # Logo BPM
+        bpm_frame = tk.Frame(frame, bg='#f0f0f0')
+        bpm_frame.pack(fill='x', padx=5, pady=2)
+        
+        tk.Label(bpm_frame, text="Logo BPM:", bg='#f0f0f0').pack(side='left')
+        self.bpm_label = tk.Label(bpm_frame, text="Non sélectionné", bg='#f0f0f0', fg='gray')
+        self.bpm_label.pack(side='left', padx=10)
+        tk.Button(bpm_frame, text="Parcourir", command=self.select_bpm_logo).pack(side='right')
+        
+        # Logo BANKILY
+        bankily_frame = tk.Frame(frame, bg='#f0f0f0')
+        bankily_frame.pack(fill='x', padx=5, pady=2)
+        
+        tk.Label(bankily_frame, text="Logo BANKILY:", bg='#f0f0f0').pack(side='left')
+        self.bankily_label = tk.Label(bankily_frame, text="Non sélectionné", bg='#f0f0f0', fg='gray')
+        self.bankily_label.pack(side='left', padx=10)
+        tk.Button(bankily_frame, text="Parcourir", command=self.select_bankily_logo).pack(side='right')
+    
+    def create_file_section(self):
+        """Section fichier Excel"""
+        frame = tk.LabelFrame(
+            self.root,
+            text=f"📊 Fichier Excel {self.TITRE}",
+            font=('Arial', 10, 'bold'),
+            bg='#f0f0f0'
+        )
+        frame.pack(fill='x', padx=10, pady=5)
+        
+        # Sélection fichier
+        file_frame = tk.Frame(frame, bg='#f0f0f0')
+        file_frame.pack(fill='x', padx=5, pady=5)
+        
+        self.select_file_btn = tk.Button(
+            file_frame,
+            text="📁 Sélectionner Fichier Excel",
+            command=self.select_file,
+            bg='#27ae60',
+            fg='white',
+            font=('Arial', 10, 'bold')
+        )
+        self.select_file_btn.pack(side='left')
+        
+        self.cancel_analysis_btn = tk.Button(
+            file_frame,
+            text="⏹️ Annuler l'analyse",
+            command=self.cancel_analysis,
+            state='disabled'
+        )
+        self.cancel_analysis_btn.pack(side='left', padx=10)
+        
+        self.file_label = tk.Label(file_frame, text="Aucun fichier sélectionné", bg='#f0f0f0', fg='gray')
+        self.file_label.pack(side='left', padx=20)
+    
+    def create_groupes_section(self):
+        """Section des groupes détectés"""
+        frame = tk.LabelFrame(
+            self.root,
+            text=f"{self.ICONE_GROUPES} {self.GROUPES.capitalize()} Détectés",
+            font=('Arial', 10, 'bold'),
+            bg='#f0f0f0'
+        )
+        frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        # Info
+        info_frame = tk.Frame(frame, bg='#f0f0f0')
+        info_frame.pack(fill='x', padx=5, pady=5)
+        
+        self.groupes_info_label = tk.Label(
+            info_frame,
+            text=f"Sélectionnez un fichier Excel pour voir les {self.GROUPES}",
+            bg='#f0f0f0',
+            fg='gray'
+        )
+        self.groupes_info_label.pack(side='left')
+        
+        # Régénération rapide des groupes sélectionnés dans la liste (Ctrl/Maj + clic)
+        self.selection_btn = tk.Button(
+            info_frame,
+            text="🎯 Générer la sélection",
+            command=self.generate_selection,
+            bg='#2980b9',
+            fg='white',
+            font=('Arial', 9, 'bold'),
+            padx=10
+        )
+        self.selection_btn.pack(side='right')
+        
+        # Liste des groupes
+        list_frame = tk.Frame(frame, bg='#f0f0f0')
+        list_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Scrollbar
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        self.groupes_listbox = tk.Listbox(
+            list_frame,
+            yscrollcommand=scrollbar.set,
+            selectmode='extended',
+            # Sélection gardée quand du texte est sélectionné ailleurs (journal)
+            exportselection=False,
+            font=('Courier', 9)
+        )
+        self.groupes_listbox.pack(fill='both', expand=True)
+        scrollbar.config(command=self.groupes_listbox.yview)
+        self.groupes_listbox.bind('<<ListboxSelect>>', self.update_selection)
+    
+    def create_controls(self):
+        """Contrôles"""
+        frame = tk.Frame(self.root, bg='#f0f0f0')
+        frame.pack(fill='x', padx=10, pady=10)
+        
+        self.generate_btn = tk.Button(
+            frame,
+            text=self.texte_generer,
+            command=self.generate_reports,
+            bg='#8e44ad',
+            fg='white',
+            font=('Arial', 12, 'bold'),
+            padx=20,
+            pady=5
+        )
+        self.generate_btn.pack(side='left')
+        
+        self.download_btn = tk.Button(
+            frame,
+            text="💾 Déplacer ZIP",
+            command=self.move_zip,
+            bg='#f39c12',
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            padx=15,
+            pady=5,
+            state='disabled'
+        )
+        self.download_btn.pack(side='left', padx=10)
+        
+        self.stop_btn = tk.Button(
+            frame,
+            text="⏹️ Arrêter",
+            command=self.stop_generation,
+            bg='#c0392b',
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            padx=15,
+            pady=5,
+            state='disabled'
+        )
+        self.stop_btn.pack(side='left')
+        
+        # Nombre de processus de rendu parallèle (1 = rendu séquentiel)
+        tk.Label(frame, text="Processus:", bg='#f0f0f0').pack(side='left', padx=(10, 0))
+        self.nb_workers = tk.IntVar(value=NB_PROCESSUS_DEFAUT)
+        tk.Spinbox(
+            frame,
+            from_=1,
+            to=os.cpu_count() or 1,
+            textvariable=self.nb_workers,
+            width=3
+        ).pack(side='left', padx=5)
+        
+        self.status_label = tk.Label(frame, text="Prêt", bg='#f0f0f0', fg='green')
+        self.status_label.pack(side='right')
+    
+    def create_log_section(self):
+        """Journal"""
+        frame = tk.LabelFrame(
+            self.root,
+            text="📝 Journal",
+            font=('Arial', 9, 'bold'),
+            bg='#f0f0f0'
+        )
+        frame.pack(fill='x', padx=10, pady=5)
+        
+        self.log_text = scrolledtext.ScrolledText(
+            frame,
+            height=6,
+            font=('Courier', 8),
+            bg='#2c3e50',
+            fg='#ecf0f1'
+        )
+        self.log_text.pack(fill='x', padx=5, pady=5)
+    
+    def create_progress(self):
+        """Progression"""
+        self.progress = ttk.Progressbar(self.root, mode='determinate')
+        self.progress.pack(fill='x', padx=10, pady=5)
+    
+    def log_message(self, message):
+        """Ajoute message au journal (affiché au prochain lot de la pompe)"""
+        self.pompe.journal(message)
+    
+    def update_progress(self, fraction):
+        """Progression de la lecture du fichier ou de la génération (fraction de 0 à 1)"""
+        self.pompe.progression(fraction)
+    
+    def check_logos(self):
+        """Vérifie logos existants"""
+        if os.path.exists("assets/bpm.png"):
+            self.logo_bpm = "assets/bpm.png"
+            self.bpm_label.config(text="bpm.png ✅", fg='green')
+        
+        if os.path.exists("assets/bankily.png"):
+            self.logo_bankily = "assets/bankily.png"
+            self.bankily_label.config(text="bankily.png ✅", fg='green')
+    
+    def select_bpm_logo(self):
+        """Sélectionne logo BPM"""
+        file_path = filedialog.askopenfilename(
+            title="Logo BPM",
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp")]
+        )
+        if file_path:
+            self.logo_bpm = file_path
+            self.bpm_label.config(text=f"{os.path.basename(file_path)} ✅", fg='green')
+            self.log_message(f"Logo BPM: {os.path.basename(file_path)}")
+    
+    def select_bankily_logo(self):
+        """Sélectionne logo BANKILY"""
+        file_path = filedialog.askopenfilename(
+            title="Logo BANKILY",
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp")]
+        )
+        if file_path:
+            self.logo_bankily = file_path
+            self.bankily_label.config(text=f"{os.path.basename(file_path)} ✅", fg='green')
+            self.log_message(f"Logo BANKILY: {os.path.basename(file_path)}")
+    
+    def select_file(self):
+        """Sélectionne le fichier Excel"""
+        file_path = filedialog.askopenfilename(
+            title=f"Fichier Excel {self.TITRE}",
+            filetypes=[("Excel", "*.xls *.xlsx")]
+        )
+        
+        if file_path:
+            self.fichier_excel = file_path
+            self.file_label.config(text=f"{os.path.basename(file_path)} ✅", fg='green')
+            self.log_message(f"Fichier sélectionné: {os.path.basename(file_path)}")
+            
+            # Analyser les groupes en arrière-plan (l'analyse du fichier précédent est abandonnée)
+            self.analyze_file()
+    
+    def analyze_file(self):
+        """Lance l'analyse du fichier en arrière-plan, en abandonnant l'analyse en cours"""
+        if self.jeton_analyse:
+            self.jeton_analyse.annuler()
+        jeton = self.jeton_analyse = JetonAnnulation()
+        
+        # Résultats du fichier précédent retirés tout de suite
+        self.groupes_data = {}
+        self.groupes_listbox.delete(0, 'end')
+        self.update_selection()
+        self.groupes_info_label.config(text="⏳ Analyse en cours...", fg='orange')
+        self.cancel_analysis_btn.config(state='normal')
+        self.update_progress(0)
+        
+        thread = threading.Thread(target=self._analyze_file, args=(self.fichier_excel, jeton))
+        thread.daemon = True
+        thread.start()
+    
+    def _analyze_file(self, fichier, jeton):
+        """Lit et regroupe le fichier (thread d'analyse), résultat affiché par _show_analysis"""
+        try:
+            self.log_message(f"🔍 Analyse des {self.GROUPES}...")
+            
+            # Fichier Excel (ou sa copie en cache s'il n'a pas changé) lu et regroupé, interruptible
+            progression = jeton.progression(self.update_progress)
+            mesures, resume, groupes, df = analyser_fichier(
+                self.CLASSE, fichier, self.log_message, progression, jeton
+            )
+            self.diagnostic(df)
+            
+            # Lignes de la liste préparées ici, insérées en un seul appel
+            lignes = [
+                self.ligne_groupe(nom, nb, total)
+                for nom, nb, total in zip(resume.index, resume['nb'], resume['total'])
+            ]
+            
+            # Génération interrompue de ce fichier (même contenu), reprise proposée à la génération
+            reprise = Reprise.pour_fichier(self.CLASSE.TYPE_RAPPORT, fichier)
+            
+            self.pompe.appeler(self._show_analysis, jeton, (mesures, groupes, lignes, len(df), reprise))
+        
+        except Annulation:
+            pass
+        except FichierInvalide as e:
+            self.pompe.appeler(self._show_analysis, jeton, erreur=str(e))
+        except Exception as e:
+            self.log_message(f"❌ Erreur analyse: {e}")
+            self.pompe.appeler(self._show_analysis, jeton, erreur=f"Erreur lors de l'analyse: {e}")
+    
+    def _show_analysis(self, jeton, resultat=None, erreur=None):
+        """Affiche le résultat de l'analyse (thread Tk), ignoré si elle a été annulée ou remplacée"""
+        if jeton is not self.jeton_analyse:
+            return
+        self.jeton_analyse = None
+        self.cancel_analysis_btn.config(state='disabled')
+        self.update_progress(0)
+        
+        if erreur:
+            self.groupes_info_label.config(text="❌ Analyse impossible", fg='red')
+            messagebox.showerror("Erreur", erreur)
+            return
+        
+        self.mesures_analyse, self.groupes_data, lignes, nb_transactions, self.reprise = resultat
+        
+        # Remplir la liste en un seul appel
+        self.groupes_listbox.insert('end', *lignes)
+        
+        # Mettre à jour l'info
+        self.groupes_info_label.config(
+            text=f"{len(self.groupes_data)} {self.GROUPES} détectés | {nb_transactions} transactions total",
+            fg='green'
+        )
+        
+        self.log_message(f"✅ {len(self.groupes_data)} {self.GROUPES} analysés")
+        if self.reprise.interrompue:
+            self.log_message(f"♻️ Génération interrompue de ce fichier: {len(self.reprise.termines)} rapports déjà produits")
+    
+    def cancel_analysis(self):
+        """Annule l'analyse en cours ; son résultat éventuel sera ignoré"""
+        if self.jeton_analyse:
+            self.jeton_analyse.annuler()
+            self.jeton_analyse = None
+            self.cancel_analysis_btn.config(state='disabled')
+            self.groupes_info_label.config(text="⏹️ Analyse annulée", fg='gray')
+            self.update_progress(0)
+            self.log_message("⏹️ Analyse annulée")
+    
+    def update_selection(self, event=None):
+        """Nombre de groupes sélectionnés sur le bouton de génération de la sélection"""
+        nb = len(self.groupes_listbox.curselection())
+        self.selection_btn.config(text=f"🎯 Générer la sélection ({nb})" if nb else "🎯 Générer la sélection")
+    
+    def generate_selection(self):
+        """Génère seulement les groupes sélectionnés dans la liste"""
+        indices = self.groupes_listbox.curselection()
+        if not indices:
+            messagebox.showwarning("Aucune sélection", f"Sélectionnez un ou plusieurs {self.GROUPES} dans la liste")
+            return
+        
+        # Lignes de la liste dans l'ordre des groupes (voir _show_analysis)
+        noms = list(self.groupes_data)
+        self.generate_reports([noms[i] for i in indices])
+    
+    def generate_reports(self, selection=None):
+        """Lance génération des rapports (de tous les groupes, ou de ceux de selection)"""
+        if not self.fichier_excel:
+            messagebox.showwarning("Aucun fichier", "Sélectionnez un fichier Excel")
+            return
+        
+        if not self.groupes_data:
+            messagebox.showwarning(f"Aucun {self.GROUPE}", f"Aucun {self.GROUPE} détecté")
+            return
+        
+        if self.processing:
+            return
+        
+        # Génération interrompue de ce fichier : reprise dans la même archive, sans refaire ses PDF
+        # (la génération d'une sélection ne touche pas au manifeste de la génération complète)
+        reprendre = selection is None and self.reprise.interrompue and messagebox.askyesno(
+            "Reprendre la génération",
+            f"Une génération de ce fichier a été interrompue ({len(self.reprise.termines)} rapports produits).\n\n"
+            f"Reprendre dans {self.reprise.sortie} ?"
+        )
+        if reprendre:
+            zip_path = self.reprise.sortie
+        else:
+            # Archive écrite directement à son emplacement final, sans copie ensuite
+            zip_path = filedialog.asksaveasfilename(
+                title="Enregistrer le ZIP",
+                defaultextension=".zip",
+                filetypes=[("ZIP", "*.zip")],
+                initialfile=nom_zip(self.CLASSE)
+            )
+            if not zip_path:
+                return
+        
+        # Données de ce fichier figées pour le thread : un autre fichier ne peut être
+        # analysé qu'après la génération (choix du fichier désactivé)
+        if selection is None:
+            groupes, reprise = self.groupes_data, self.reprise
+        else:
+            # Sélection : seulement ces groupes, sans manifeste de reprise
+            groupes, reprise = {nom: self.groupes_data[nom] for nom in selection}, None
+        mesures = Mesures(self.mesures_analyse.etapes)
+        
+        self.processing = True
+        self.generate_btn.config(state='disabled', text="⏳ Génération...")
+        self.selection_btn.config(state='disabled')
+        self.select_file_btn.config(state='disabled')
+        self.download_btn.config(state='disabled')
+        
+        # Arrêt possible pendant toute la génération (bouton Arrêter)
+        self.jeton_generation = JetonAnnulation()
+        self.stop_btn.config(state='normal')
+        
+        try:
+            nb_workers = max(1, int(self.nb_workers.get()))
+        except (tk.TclError, ValueError):
+            nb_workers = 1
+        
+        self.log_message(f"🚀 Début génération {self.TITRE.lower()}")
+        if selection is not None:
+            self.log_message(f"🎯 Sélection: {len(groupes)} {self.GROUPE}(s) sur {len(self.groupes_data)}")
+        
+        thread = threading.Thread(target=self._process_groupes,
+                                  args=(groupes, reprise, mesures, zip_path, nb_workers, self.jeton_generation,
+                                        reprendre, selection, self.fichier_excel))
+        thread.daemon = True
+        thread.start()
+    
+    def _process_groupes(self, groupes, reprise, mesures, zip_path, nb_workers=1, jeton=None,
+                         reprendre=False, selection=None, fichier=None):
+        """Génère un rapport par groupe dans l'archive (thread de génération)"""
+        try:
+            pdf_files, _ = generer_sortie(
+                self.CLASSE, groupes, zip_path, fichier,
+                logos=(self.logo_bpm, self.logo_bankily),
+                nb_processus=nb_workers,
+                journal=self.log_message,
+                progression=self.update_progress,
+                mesures=mesures,
+                annulation=jeton,
+                reprise=reprise,
+                reprendre=reprendre,
+                cache_pdf=DOSSIER_CACHE_PDF,
+                selection=selection
+            )
+            
+            if pdf_files:
+                self.zip_path = zip_path
+                self.pompe.appeler(self.download_btn.config, state='normal')
+        
+        except Exception as e:
+            self.log_message(f"❌ Erreur globale: {e}")
+        
+        finally:
+            self.processing = False
+            self.pompe.appeler(self.stop_btn.config, state='disabled')
+            self.pompe.appeler(self.selection_btn.config, state='normal')
+            self.pompe.appeler(self.select_file_btn.config, state='normal')
+            self.pompe.appeler(self.generate_btn.config, state='normal', text=self.texte_generer)
+            self.pompe.appeler(self.progress.config, value=0)
+    
+    def stop_generation(self):
+        """Arrête la génération : les rapports en cours se terminent, les suivants sont sautés"""
+        if self.processing and self.jeton_generation:
+            self.jeton_generation.annuler()
+            self.stop_btn.config(state='disabled')
+            self.log_message("⏹️ Arrêt demandé: fin des rapports en cours...")
+    
+    def move_zip(self):
+        """Déplace le ZIP (renommage si même disque, sans recopie)"""
+        if self.zip_path and os.path.exists(self.zip_path):
+            save_path = filedialog.asksaveasfilename(
+                title="Déplacer ZIP",
+                defaultextension=".zip",
+                filetypes=[("ZIP", "*.zip")],
+                initialdir=os.path.dirname(self.zip_path),
+                initialfile=os.path.basename(self.zip_path)
+            )
+            
+            if save_path:
+                try:
+                    ancien = self.zip_path
+                    self.zip_path = deplacer_fichier(ancien, save_path)
+                    # Rapport de mesures déplacé avec son archive
+                    if os.path.exists(chemin_rapport(ancien)):
+                        deplacer_fichier(chemin_rapport(ancien), chemin_rapport(save_path))
+                    self.log_message(f"💾 Déplacé: {save_path}")
+                    messagebox.showinfo("Succès", f"ZIP déplacé:\n{save_path}")
+                except Exception as e:
+                    self.log_message(f"❌ Erreur: {e}")
+        else:
+            messagebox.showwarning("Aucun fichier", "Pas de ZIP à déplacer")
@@ -7,667 +7,34 @@ CORRECTION: Résolution du chevauchement du nom du commerçant
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-from tkcalendar import DateEntry
-import os
-import zipfile
-import tempfile
-import shutil
-from datetime import datetime, date
-import threading
-
-# Imports reportlab
+import multiprocessing
+
+from interface_multi import RapportMultiGUI
+
+# Moteur de rapports (pandas, reportlab)
 try:
-    import pandas as pd
-    from reportlab.lib.pagesizes import A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import cm
-    from reportlab.lib.colors import Color
-    from reportlab.lib import colors
-    REPORTLAB_OK = True
+    from bankily_engine.commercants import GenerateurPDFCommercants
 except ImportError as e:
     print(f"Erreur d'import: {e}")
-    REPORTLAB_OK = False
-
-
-class RapportMultiCommerccantsGUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("🛒 Générateur de Rapports Multi-Commerçants - BANKILY")
-        self.root.geometry("900x700")
-        self.root.configure(bg='#f0f0f0')
-        
-        # Variables
-        self.fichier_excel = None
-        self.logo_bpm = None
-        self.logo_bankily = None
-        self.processing = False
-        self.commercants_data = {}
-        
-        # Vérification des dépendances
-        if not REPORTLAB_OK:
-            self.show_dependency_error()
-            return
-        
-        # Setup styles
-        self.setup_pdf_styles()
-        
-        # Interface
-        self.create_interface()
-        
-        # Vérifier logos
-        self.check_logos()
-    
-    def show_dependency_error(self):
-        """Affiche erreur dépendances"""
-        error_frame = tk.Frame(self.root, bg='#e74c3c', padx=20, pady=20)
-        error_frame.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        tk.Label(
-            error_frame,
-            text="❌ ERREUR DE DÉPENDANCES",
-            font=('Arial', 16, 'bold'),
-            fg='white',
-            bg='#e74c3c'
-        ).pack(pady=10)
-        
-        tk.Label(
-            error_frame,
-            text="pip install pandas openpyxl xlrd reportlab tkcalendar",
-            font=('Courier', 10),
-            fg='white',
-            bg='#c0392b',
-            relief='sunken',
-            padx=10,
-            pady=10
-        ).pack(pady=10)
-    
-    def setup_pdf_styles(self):
-        """Configure styles PDF"""
-        self.styles = getSampleStyleSheet()
-        
-        # Titre noir
-        self.styles.add(ParagraphStyle(
-            name='TitreBanque',
-            parent=self.styles['Title'],
-            fontSize=16,
-            spaceAfter=15,
-            alignment=1,
-            textColor=colors.black
-        ))
-    
-    def create_interface(self):
-        """Crée l'interface"""
-        # Titre
-        title_frame = tk.Frame(self.root, bg='#2c3e50', height=70)
-        title_frame.pack(fill='x', padx=10, pady=10)
-        title_frame.pack_propagate(False)
-        
-        tk.Label(
-            title_frame,
-            text="🛒 Générateur de Rapports Multi-Commerçants",
-            font=('Arial', 18, 'bold'),
-            fg='white',
-            bg='#2c3e50'
-        ).pack(expand=True)
-        
-        # Sections
-        self.create_logo_section()
-        self.create_file_section()
-        self.create_commercants_section()
-        self.create_controls()
-        self.create_log_section()
-        self.create_progress()
-    
-    def create_logo_section(self):
-        """Section logos"""
-        frame = tk.LabelFrame(
-            self.root,
-            text="📷 Logos",
-            font=('Arial', 10, 'bold'),
-            bg='#f0f0f0'
-        )
-        frame.pack(fill='x', padx=10, pady=5)
-        
-        # Logo BPM
-        bpm_frame = tk.Frame(frame, bg='#f0f0f0')
-        bpm_frame.pack(fill='x', padx=5, pady=2)
-        
-        tk.Label(bpm_frame, text="Logo BPM:", bg='#f0f0f0').pack(side='left')
-        self.bpm_label = tk.Label(bpm_frame, text="Non sélectionné", bg='#f0f0f0', fg='gray')
-        self.bpm_label.pack(side='left', padx=10)
-        tk.Button(bpm_frame, text="Parcourir", command=self.select_bpm_logo).pack(side='right')
-        
-        # Logo BANKILY
-        bankily_frame = tk.Frame(frame, bg='#f0f0f0')
-        bankily_frame.pack(fill='x', padx=5, pady=2)
-        
-        tk.Label(bankily_frame, text="Logo BANKILY:", bg='#f0f0f0').pack(side='left')
-        self.bankily_label = tk.Label(bankily_frame, text="Non sélectionné", bg='#f0f0f0', fg='gray')
-        self.bankily_label.pack(side='left', padx=10)
-        tk.Button(bankily_frame, text="Parcourir", command=self.select_bankily_logo).pack(side='right')
-    
-    def create_file_section(self):
-        """Section fichier Excel"""
-        frame = tk.LabelFrame(
-            self.root,
-            text="📊 Fichier Excel Multi-Commerçants",
-            font=('Arial', 10, 'bold'),
-            bg='#f0f0f0'
-        )
-        frame.pack(fill='x', padx=10, pady=5)
-        
-        # Sélection fichier
-        file_frame = tk.Frame(frame, bg='#f0f0f0')
-        file_frame.pack(fill='x', padx=5, pady=5)
-        
-        tk.Button(
-            file_frame,
-            text="📁 Sélectionner Fichier Excel",
-            command=self.select_file,
-            bg='#27ae60',
-            fg='white',
-            font=('Arial', 10, 'bold')
-        ).pack(side='left')
-        
-        self.file_label = tk.Label(file_frame, text="Aucun fichier sélectionné", bg='#f0f0f0', fg='gray')
-        self.file_label.pack(side='left', padx=20)
-    
-    def create_commercants_section(self):
-        """Section des commerçants détectés"""
-        frame = tk.LabelFrame(
-            self.root,
-            text="🛒 Commerçants Détectés",
-            font=('Arial', 10, 'bold'),
-            bg='#f0f0f0'
-        )
-        frame.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        # Info
-        info_frame = tk.Frame(frame, bg='#f0f0f0')
-        info_frame.pack(fill='x', padx=5, pady=5)
-        
-        self.commercants_info_label = tk.Label(
-            info_frame,
-            text="Sélectionnez un fichier Excel pour voir les commerçants",
-            bg='#f0f0f0',
-            fg='gray'
-        )
-        self.commercants_info_label.pack(side='left')
-        
-        # Liste des commerçants
-        list_frame = tk.Frame(frame, bg='#f0f0f0')
-        list_frame.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Scrollbar
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        self.commercants_listbox = tk.Listbox(
-            list_frame,
-            yscrollcommand=scrollbar.set,
-            selectmode='extended',
-            font=('Courier', 9)
-        )
-        self.commercants_listbox.pack(fill='both', expand=True)
-        scrollbar.config(command=self.commercants_listbox.yview)
-    
-    def create_controls(self):
-        """Contrôles"""
-        frame = tk.Frame(self.root, bg='#f0f0f0')
-        frame.pack(fill='x', padx=10, pady=10)
-        
-        self.generate_btn = tk.Button(
-            frame,
-            text="🚀 Générer Rapports par Commerçant",
-            command=self.generate_reports,
-            bg='#8e44ad',
-            fg='white',
-            font=('Arial', 12, 'bold'),
-            padx=20,
-            pady=5
-        )
-        self.generate_btn.pack(side='left')
-        
-        self.download_btn = tk.Button(
-            frame,
-            text="💾 Télécharger ZIP",
-            command=self.download_zip,
-            bg='#f39c12',
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            padx=15,
-            pady=5,
-            state='disabled'
-        )
-        self.download_btn.pack(side='left', padx=10)
-        
-        self.status_label = tk.Label(frame, text="Prêt", bg='#f0f0f0', fg='green')
-        self.status_label.pack(side='right')
-    
-    def create_log_section(self):
-        """Journal"""
-        frame = tk.LabelFrame(
-            self.root,
-            text="📝 Journal",
-            font=('Arial', 9, 'bold'),
-            bg='#f0f0f0'
-        )
-        frame.pack(fill='x', padx=10, pady=5)
-        
-        self.log_text = scrolledtext.ScrolledText(
-            frame,
-            height=6,
-            font=('Courier', 8),
-            bg='#2c3e50',
-            fg='#ecf0f1'
-        )
-        self.log_text.pack(fill='x', padx=5, pady=5)
-    
-    def create_progress(self):
-        """Progression"""
-        self.progress = ttk.Progressbar(self.root, mode='determinate')
-        self.progress.pack(fill='x', padx=10, pady=5)
-    
-    def log_message(self, message):
-        """Ajoute message au journal"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert('end', f"[{timestamp}] {message}\n")
-        self.log_text.see('end')
-        self.root.update_idletasks()
-    
-    def check_logos(self):
-        """Vérifie logos existants"""
-        if os.path.exists("assets/bpm.png"):
-            self.logo_bpm = "assets/bpm.png"
-            self.bpm_label.config(text="bpm.png ✅", fg='green')
-        
-        if os.path.exists("assets/bankily.png"):
-            self.logo_bankily = "assets/bankily.png"
-            self.bankily_label.config(text="bankily.png ✅", fg='green')
-    
-    def select_bpm_logo(self):
-        """Sélectionne logo BPM"""
-        file_path = filedialog.askopenfilename(
-            title="Logo BPM",
-            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp")]
-        )
-        if file_path:
-            self.logo_bpm = file_path
-            self.bpm_label.config(text=f"{os.path.basename(file_path)} ✅", fg='green')
-            self.log_message(f"Logo BPM: {os.path.basename(file_path)}")
-    
-    def select_bankily_logo(self):
-        """Sélectionne logo BANKILY"""
-        file_path = filedialog.askopenfilename(
-            title="Logo BANKILY",
-            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp")]
-        )
-        if file_path:
-            self.logo_bankily = file_path
-            self.bankily_label.config(text=f"{os.path.basename(file_path)} ✅", fg='green')
-            self.log_message(f"Logo BANKILY: {os.path.basename(file_path)}")
-    
-    def select_file(self):
-        """Sélectionne le fichier Excel"""
-        file_path = filedialog.askopenfilename(
-            title="Fichier Excel Multi-Commerçants",
-            filetypes=[("Excel", "*.xls *.xlsx")]
-        )
-        
-        if file_path:
-            self.fichier_excel = file_path
-            self.file_label.config(text=f"{os.path.basename(file_path)} ✅", fg='green')
-            self.log_message(f"Fichier sélectionné: {os.path.basename(file_path)}")
-            
-            # Analyser les commerçants
-            self.analyze_commercants()
-    
-    def analyze_commercants(self):
-        """Analyse les commerçants dans le fichier"""
-        try:
-            self.log_message("🔍 Analyse des commerçants...")
-            
-            # Lire le fichier Excel en préservant les types de données
-            if self.fichier_excel.endswith('.xls'):
-                df = pd.read_excel(self.fichier_excel, engine='xlrd', dtype={'ID': str})
-            else:
-                df = pd.read_excel(self.fichier_excel, engine='openpyxl', dtype={'ID': str})
-            
-            # Vérifier si la colonne COMMERCANT existe
-            if 'COMMERCANT' not in df.columns:
-                messagebox.showerror("Erreur", "La colonne 'COMMERCANT' est introuvable dans le fichier Excel")
-                return
-            
-            # Nettoyer les données et conserver les ID comme strings
-            df['ID'] = df['ID'].astype(str)  # S'assurer que les ID restent des strings
-            
-            # Grouper par commerçant
-            commercants_groups = df.groupby('COMMERCANT')
-            self.commercants_data = {}
-            
-            # Vider la liste
-            self.commercants_listbox.delete(0, 'end')
-            
-            # Ajouter chaque commerçant
-            for commercant, data in commercants_groups:
-                count = len(data)
-                total = data['MONTANT'].sum() if 'MONTANT' in data.columns else 0
-                
-                self.commercants_data[commercant] = data
-                
-                # Afficher dans la liste
-                display_text = f"{commercant:<30} | {count:>3} transactions | {total:>10,.0f} MRU".replace(',', ' ')
-                self.commercants_listbox.insert('end', display_text)
-            
-            # Mettre à jour l'info
-            self.commercants_info_label.config(
-                text=f"{len(self.commercants_data)} commerçants détectés | {len(df)} transactions total",
-                fg='green'
-            )
-            
-            self.log_message(f"✅ {len(self.commercants_data)} commerçants analysés")
-            
-        except Exception as e:
-            self.log_message(f"❌ Erreur analyse: {e}")
-            messagebox.showerror("Erreur", f"Erreur lors de l'analyse: {e}")
-    
-    def generate_reports(self):
-        """Lance génération des rapports"""
-        if not self.fichier_excel:
-            messagebox.showwarning("Aucun fichier", "Sélectionnez un fichier Excel")
-            return
-        
-        if not self.commercants_data:
-            messagebox.showwarning("Aucun commerçant", "Aucun commerçant détecté")
-            return
-        
-        if self.processing:
-            return
-        
-        self.processing = True
-        self.generate_btn.config(state='disabled', text="⏳ Génération...")
-        self.download_btn.config(state='disabled')
-        
-        thread = threading.Thread(target=self._process_commercants)
-        thread.daemon = True
-        thread.start()
-    
-    def _process_commercants(self):
-        """Traite chaque commerçant"""
-        try:
-            self.log_message("🚀 Début génération multi-commerçants")
-            
-            with tempfile.TemporaryDirectory() as temp_dir:
-                pdf_files = []
-                total_commercants = len(self.commercants_data)
-                
-                for i, (commercant, data) in enumerate(self.commercants_data.items()):
-                    try:
-                        self.log_message(f"🛒 [{i+1}/{total_commercants}] Commerçant: {commercant}")
-                        
-                        pdf_path = self.create_commercant_pdf(commercant, data, temp_dir)
-                        if pdf_path:
-                            pdf_files.append(pdf_path)
-                            transactions_count = len(data)
-                            self.log_message(f"✅ PDF {commercant}: {transactions_count} transactions")
-                        
-                        progress = ((i + 1) / total_commercants) * 100
-                        self.progress['value'] = progress
-                        self.root.update_idletasks()
-                        
-                    except Exception as e:
-                        self.log_message(f"❌ Erreur commerçant {commercant}: {e}")
-                
-                if pdf_files:
-                    self.log_message("📦 Création ZIP multi-commerçants...")
-                    self.zip_path = self.create_zip(pdf_files)
-                    self.log_message(f"🎉 ZIP créé: {len(pdf_files)} rapports")
-                    self.root.after(0, lambda: self.download_btn.config(state='normal'))
-                else:
-                    self.log_message("❌ Aucun PDF généré")
-        
-        except Exception as e:
-            self.log_message(f"❌ Erreur globale: {e}")
-        
-        finally:
-            self.processing = False
-            self.root.after(0, lambda: self.generate_btn.config(state='normal', text="🚀 Générer Rapports par Commerçant"))
-            self.root.after(0, lambda: self.progress.config(value=0))
-    
-    def create_commercant_pdf(self, commercant_nom, commercant_data, output_dir):
-        """Crée PDF pour un commerçant"""
-        try:
-            # Nom du PDF
-            date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nom_pdf = f"Rapport_{commercant_nom.replace(' ', '_')}_{date_str}.pdf"
-            pdf_path = os.path.join(output_dir, nom_pdf)
-            
-            doc = SimpleDocTemplate(
-                pdf_path,
-                pagesize=A4,
-                rightMargin=1.5*cm,
-                leftMargin=1.5*cm,
-                topMargin=2*cm,
-                bottomMargin=2*cm
-            )
-            
-            story = []
-            
-            # En-tête
-            self.add_header(story, commercant_nom)
-            
-            # Tableau
-            self.add_table(story, commercant_data, commercant_nom)
-            
-            # Résumé
-            self.add_summary(story, commercant_data)
-            
-            doc.build(story)
-            return pdf_path
-        
-        except Exception as e:
-            self.log_message(f"❌ Erreur PDF {commercant_nom}: {e}")
-            return None
-    
-    def add_header(self, story, commercant_nom):
-        """En-tête style BANKILY"""
-        # Logos
-        if self.logo_bpm and os.path.exists(self.logo_bpm):
-            if self.logo_bankily and os.path.exists(self.logo_bankily):
-                data = [[
-                    Image(self.logo_bpm, width=3*cm, height=2*cm, kind='proportional'),
-                    "",
-                    Image(self.logo_bankily, width=3*cm, height=2*cm)
-                ]]
-                table = Table(data, colWidths=[4*cm, 9*cm, 4*cm])
-                table.setStyle(TableStyle([
-                    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                    ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                story.append(table)
-                story.append(Spacer(1, 20))
-        
-        # Titre
-        story.append(Paragraph(
-            "<b>Relevé de paiement commerçant BANKILY</b>", 
-            self.styles['TitreBanque']
-        ))
-        story.append(Spacer(1, 20))
-    
-    def add_table(self, story, df, commercant_nom):
-        """Tableau style BANKILY - VERSION CORRIGÉE ALIGNEMENT"""
-        # Calculer les dates automatiquement à partir des données du commerçant
-        df['DATEP'] = pd.to_datetime(df['DATEP'])
-        date_debut_auto = df['DATEP'].min().strftime("%d/%m/%Y")
-        date_fin_auto = df['DATEP'].max().strftime("%d/%m/%Y")
-        
-        # CORRECTION: Largeur de colonne étiquette fixe pour alignement parfait
-        largeur_etiquette = 4*cm
-        largeur_valeur = 13*cm
-        
-        # Style commun pour toutes les informations - ALIGNEMENT UNIFORME
-        style_info_uniforme = TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ])
-        
-        # CORRECTION: Nom du commerçant COMPLET sans coupure
-        info1 = [["Nom du commerçant :", commercant_nom]]  # Nom complet sans limitation
-        table1 = Table(info1, colWidths=[largeur_etiquette, largeur_valeur])
-        table1.setStyle(style_info_uniforme)
-        story.append(table1)
-        story.append(Spacer(1, 2))
-        
-        # CORRECTION: Dates avec espacement amélioré pour "jusqu'au"
-        info2 = [["Date du :", f"{date_debut_auto}   jusqu'au   {date_fin_auto}"]]
-        table2 = Table(info2, colWidths=[largeur_etiquette, largeur_valeur])
-        table2.setStyle(style_info_uniforme)
-        story.append(table2)
-        story.append(Spacer(1, 2))
-        
-        # CORRECTION: Total transactions au lieu de total crédit
-        total_montant = df['MONTANT'].sum()
-        nombre_transactions = len(df)
-        
-        # Total transactions (nombre)
-        info3 = [["Total transactions :", f"{nombre_transactions}"]]
-        table3 = Table(info3, colWidths=[largeur_etiquette, largeur_valeur])
-        table3.setStyle(style_info_uniforme)
-        story.append(table3)
-        story.append(Spacer(1, 2))
-        
-        # Total paiement (montant)
-        info4 = [["Total paiement :", f"{total_montant:,.1f} MRU".replace(',', ' ')]]
-        table4 = Table(info4, colWidths=[largeur_etiquette, largeur_valeur])
-        table4.setStyle(style_info_uniforme)
-        story.append(table4)
-        
-        story.append(Spacer(1, 20))
-        
-        # Tableau principal - CORRECTION des largeurs
-        df_sorted = df.sort_values('DATEP', ascending=False)
-        
-        data = [["ID", "Date crédit compte", "Client", "Commerçant", "Montant de crédit"]]
-        
-        for _, row in df_sorted.iterrows():
-            # Conserver l'ID complet comme string
-            num_transaction = str(row['ID']).strip()
-            if 'ID' in row and pd.notna(row['ID']):
-                if isinstance(row['ID'], (int, float)):
-                    num_transaction = f"{int(row['ID'])}"
-                else:
-                    num_transaction = str(row['ID']).strip()
-            
-            date_formatted = pd.to_datetime(row['DATEP']).strftime('%d/%m/%Y %H:%M')
-            client = str(row['CLIENT']) if 'CLIENT' in row else ""
-            
-            # CORRECTION: Nom du commerçant COMPLET sans coupure dans le tableau
-            commercant_affiche = commercant_nom  # Nom complet préservé
-            
-            data.append([
-                num_transaction,
-                date_formatted,
-                client,
-                commercant_affiche,  # Nom complet sans limitation
-                f"{row['MONTANT']:,.1f}".replace(',', ' ')
-            ])
-        
-        # CORRECTION: Largeurs optimisées pour noms longs sans coupure
-        table = Table(data, colWidths=[3.8*cm, 3.2*cm, 2.5*cm, 4.5*cm, 3*cm])
-        table.setStyle(TableStyle([
-            # En-tête
-            ('BACKGROUND', (0, 0), (-1, 0), Color(0.7, 0.8, 1.0)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            
-            # Corps - optimisé pour noms longs
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 7),
-            ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # ID
-            ('ALIGN', (1, 1), (1, -1), 'CENTER'),  # Date
-            ('ALIGN', (2, 1), (2, -1), 'CENTER'),  # Client
-            ('ALIGN', (3, 1), (3, -1), 'LEFT'),    # Commerçant - aligné à gauche
-            ('ALIGN', (4, 1), (4, -1), 'RIGHT'),   # Montant
-            
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            
-            # CORRECTION: Padding ajusté pour noms longs
-            ('LEFTPADDING', (0, 0), (-1, -1), 2),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-            
-            # Gestion intelligente du texte long - wrap uniquement si nécessaire
-            ('WORDWRAP', (3, 1), (3, -1), True),  # Wrap seulement pour la colonne Commerçant
-        ]))
-        
-        story.append(table)
-        story.append(Spacer(1, 20))
-    
-    def add_summary(self, story, df):
-        """Résumé"""
-        story.append(Spacer(1, 30))
-        
-        total = df['MONTANT'].sum()
-        data = [[f"Total : {total:,.1f} MRU".replace(',', ' ')]]
-        
-        table = Table(data, colWidths=[17*cm])
-        table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-        ]))
-        
-        story.append(table)
-    
-    def create_zip(self, pdf_files):
-        """Crée ZIP"""
-        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_name = f"Rapports_Multi_Commercants_{date_str}.zip"
-        zip_path = os.path.join(os.getcwd(), zip_name)
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for pdf_file in pdf_files:
-                zipf.write(pdf_file, os.path.basename(pdf_file))
-        
-        return zip_path
+    GenerateurPDFCommercants = None
+
+
+class RapportMultiCommerccantsGUI(RapportMultiGUI):
+    CLASSE = GenerateurPDFCommercants
+    TITRE = "Multi-Commerçants"
+    ICONE = "🛒"
+    ICONE_GROUPES = "🛒"
+    GROUPE = "commerçant"
+    GROUPES = "commerçants"
     
-    def download_zip(self):
-        """Télécharge ZIP"""
-        if hasattr(self, 'zip_path') and os.path.exists(self.zip_path):
-            save_path = filedialog.asksaveasfilename(
-                title="Sauvegarder ZIP",
-                defaultextension=".zip",
-                filetypes=[("ZIP", "*.zip")],
-                initialname=os.path.basename(self.zip_path)
-            )
-            
-            if save_path:
-                try:
-                    shutil.copy2(self.zip_path, save_path)
-                    self.log_message(f"💾 Sauvegardé: {save_path}")
-                    messagebox.showinfo("Succès", f"ZIP sauvegardé:\n{save_path}")
-                except Exception as e:
-                    self.log_message(f"❌ Erreur: {e}")
-        else:
-            messagebox.showwarning("Aucun fichier", "Pas de ZIP à télécharger")
+    def ligne_groupe(self, commercant, count, total):
+        return f"{commercant:<30} | {count:>3} transactions | {total:>10,.0f} MRU".replace(',', ' ')
 
 
 def main():
     """Lance l'application"""
+    # Requis pour le pool de processus dans l'exécutable PyInstaller
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = RapportMultiCommerccantsGUI(root)
     root.mainloop()